@@ -3,9 +3,12 @@
 Displays decorative information about CLDPM, author, and Transilience.
 """
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
+import sys
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.text import Text
 
 BANNER_ASCII = r"""
     ██████╗██╗     ██████╗ ██████╗ ███╗   ███╗
@@ -17,55 +20,81 @@ BANNER_ASCII = r"""
 """
 
 
-def print_banner(console: Console | None = None) -> None:
-    """Print the CLDPM installation/info banner."""
-    if console is None:
-        console = Console()
+# Markup lines shown below the ASCII art, rendered in a single print call
+_BANNER_LINES = [
+    "  [bold cyan]Claude Project Manager[/bold cyan]",
+    "  [dim]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/dim]",
+    "",
+    # Description
+    "  [white]Manage mono repos with multiple Claude Code[/white]",
+    "  [white]projects. Share skills, agents, hooks, and[/white]",
+    "  [white]rules across projects without duplication.[/white]",
+    "",
+    "  [dim]─────────────────────────────────────────[/dim]",
+    "",
+    # Quick Start
+    "  [yellow]Quick Start:[/yellow]",
+    "  [dim]$[/dim] [white]cldpm init my-monorepo[/white]",
+    "  [dim]$[/dim] [white]cldpm create project web-app[/white]",
+    "  [dim]$[/dim] [white]cldpm create skill logging[/white]",
+    "  [dim]$[/dim] [white]cldpm add skill:logging --to web-app[/white]",
+    "",
+    "  [dim]─────────────────────────────────────────[/dim]",
+    "",
+    # Attribution
+    "  [magenta]◆[/magenta] [dim]Crafted by[/dim] [cyan]Transilience.ai[/cyan]",
+    "",
+    "  [dim]─────────────────────────────────────────[/dim]",
+    "",
+    # Links
+    "  [dim]Docs:[/dim]    [underline cyan]https://cldpm.transilience.ai[/underline cyan]",
+    "  [dim]GitHub:[/dim]  [underline cyan]https://github.com/transilienceai/cldpm[/underline cyan]",
+    "",
+    "  [dim]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/dim]",
+    "",
+]
 
-    # ASCII art
-    ascii_text = Text(BANNER_ASCII, style="bold magenta")
-    console.print(ascii_text)
 
-    # Title
-    console.print("  [bold cyan]Claude Project Manager[/bold cyan]")
-    console.print("  [dim]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/dim]")
-    console.print()
+_BANNER_MARKUP = "\n".join([f"[bold magenta]{BANNER_ASCII}[/bold magenta]", *_BANNER_LINES])
 
-    # Description
-    console.print("  [white]Manage mono repos with multiple Claude Code[/white]")
-    console.print("  [white]projects. Share skills, agents, hooks, and[/white]")
-    console.print("  [white]rules across projects without duplication.[/white]")
-    console.print()
-    console.print("  [dim]─────────────────────────────────────────[/dim]")
-    console.print()
+# Parsed on first use; treated as read-only since rich Text is mutable
+_banner_text: "Text | None" = None
 
-    # Quick Start
-    console.print("  [yellow]Quick Start:[/yellow]")
-    console.print("  [dim]$[/dim] [white]cldpm init my-monorepo[/white]")
-    console.print("  [dim]$[/dim] [white]cldpm create project web-app[/white]")
-    console.print("  [dim]$[/dim] [white]cldpm create skill logging[/white]")
-    console.print("  [dim]$[/dim] [white]cldpm add skill:logging --to web-app[/white]")
-    console.print()
-    console.print("  [dim]─────────────────────────────────────────[/dim]")
-    console.print()
+# Final ANSI output for the default console, captured on first use
+_banner_ansi: Optional[str] = None
 
-    # Attribution
-    console.print("  [magenta]◆[/magenta] [dim]Crafted by[/dim] [cyan]Transilience.ai[/cyan]")
-    console.print()
-    console.print("  [dim]─────────────────────────────────────────[/dim]")
-    console.print()
 
-    # Links
-    console.print("  [dim]Docs:[/dim]    [cyan]https://cldpm.transilience.ai[/cyan]")
-    console.print("  [dim]GitHub:[/dim]  [cyan]https://github.com/transilienceai/cldpm[/cyan]")
-    console.print()
-    console.print("  [dim]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/dim]")
-    console.print()
+def print_banner(console: "Console | None" = None) -> None:
+    """Print the CLDPM installation/info banner."""
+    # rich is imported lazily so importing this module stays cheap
+    from rich.console import Console
+    from rich.text import Text
 
+    global _banner_text, _banner_ansi
+    if _banner_text is None:
+        _banner_text = Text.from_markup(_BANNER_MARKUP)
 
-def get_banner_text() -> str:
-    """Get banner as plain text for non-TTY environments."""
-    return f"""
+    # An explicitly passed console keeps full rich rendering
+    if console is not None:
+        console.print(_banner_text)
+        return
+
+    if _banner_ansi is None:
+        console = Console()
+        if console.legacy_windows:
+            # Legacy Windows consoles are styled through the Win32 API, not ANSI
+            console.print(_banner_text)
+            return
+        with console.capture() as capture:
+            console.print(_banner_text)
+        _banner_ansi = capture.get()
+
+    sys.stdout.write(_banner_ansi)
+    sys.stdout.flush()
+
+
+# Plain-text banner; fully static, so assembled once at import
+_BANNER_TEXT_PLAIN = f"""
 {BANNER_ASCII}
   Claude Project Manager
   ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -95,3 +124,8 @@ def get_banner_text() -> str:
 
   ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
+
+
+def get_banner_text() -> str:
+    """Get banner as plain text for non-TTY environments."""
+    return _BANNER_TEXT_PLAIN
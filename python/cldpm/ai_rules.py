@@ -1,7 +1,10 @@
 """AI rules content for various AI coding assistants."""
 
-import re
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import AnyStr, Callable, Optional
 
 
 # Common section markers for all AI tools
@@ -11,10 +14,36 @@ CLDPM_SECTION_END = "<!-- CLDPM-SECTION-END -->"
 # Legacy marker for backwards compatibility
 CLDPM_SECTION_MARKER = "<!-- CLDPM-MANAGED-SECTION -->"
 
+# Encoded markers for splicing files as raw bytes
+_SECTION_START_BYTES = CLDPM_SECTION_START.encode()
+_SECTION_END_BYTES = CLDPM_SECTION_END.encode()
+_SECTION_MARKER_BYTES = CLDPM_SECTION_MARKER.encode()
 
-def get_cursorrules_content(repo_name: str, projects_dir: str, shared_dir: str) -> str:
-    """Get content for .cursor/rules/cldpm.mdc file."""
-    return f"""---
+# Installation instructions shared by the generated rules files
+_INSTALL_BLOCK_PY_FIRST = """## Installation
+
+**BEFORE running `cldpm` commands**, check if installed and install if needed:
+
+1. **Check**: `which cldpm` or `cldpm --version`
+2. **If missing, detect environment and install**:
+   - **Python detected** (pyproject.toml, requirements.txt, setup.py, or python/python3 exists): `pip install cldpm` or `pip3 install cldpm`
+   - **Node.js/TypeScript detected** (package.json, tsconfig.json, or node/npm exists): `npm install -g cldpm`
+   - **Default**: `pip install cldpm` or `pip3 install cldpm`"""
+
+_INSTALL_BLOCK_NODE_FIRST = """## Installation
+
+**BEFORE running `cldpm` commands**, check if installed and install if needed:
+
+1. **Check**: `which cldpm` or `cldpm --version`
+2. **If missing, detect environment and install**:
+   - **Node.js/TypeScript detected** (node/npm exists): `npm install -g cldpm`
+   - **Python detected** (python/python3 exists): `pip install cldpm` or `pip3 install cldpm`
+   - **Priority**: First try Node.js/TypeScript, then Python"""
+
+
+# Content templates are built once at import with the section markers and shared
+# blocks baked in; only the repo-specific names remain as str.format placeholders.
+_CURSORRULES_TEMPLATE = f"""---
 description: CLDPM mono repo - ALWAYS use cldpm CLI for project management
 globs:
   - "**/*"
@@ -58,14 +87,14 @@ When the user asks you to perform any of these actions, **run the corresponding
 ## Directory Structure
 
 ```
-{repo_name}/
+{{repo_name}}/
 ├── cldpm.json              # Root configuration (DO NOT edit manually)
-├── {shared_dir}/           # Shared components
+├── {{shared_dir}}/           # Shared components
 │   ├── skills/
 │   ├── agents/
 │   ├── hooks/
 │   └── rules/
-└── {projects_dir}/         # Individual projects
+└── {{projects_dir}}/         # Individual projects
     └── <project>/
         ├── project.json    # Project manifest (managed by cldpm)
         └── .claude/        # Symlinked + local components
@@ -104,9 +133,15 @@ When the user asks you to perform any of these actions, **run the corresponding
 """
 
 
-def get_clinerules_content(_repo_name: str, projects_dir: str, shared_dir: str) -> str:
-    """Get content for .clinerules file."""
-    return f"""{CLDPM_SECTION_START}
+@lru_cache(maxsize=32)
+def get_cursorrules_content(repo_name: str, projects_dir: str, shared_dir: str) -> str:
+    """Get content for .cursor/rules/cldpm.mdc file."""
+    return _CURSORRULES_TEMPLATE.format(
+        repo_name=repo_name, projects_dir=projects_dir, shared_dir=shared_dir
+    )
+
+
+_CLINERULES_TEMPLATE = f"""{CLDPM_SECTION_START}
 # CLDPM Mono Repo - USE CLI COMMANDS
 
 This repo uses CLDPM. **Execute these commands** for project management:
@@ -138,27 +173,23 @@ cldpm sync --all                      # Restore symlinks after git clone
 - "show project" → RUN `cldpm get <project>`
 - "export" → RUN `cldpm get <project> --download -o <dir>`
 
-## Installation
-
-**BEFORE running `cldpm` commands**, check if installed and install if needed:
-
-1. **Check**: `which cldpm` or `cldpm --version`
-2. **If missing, detect environment and install**:
-   - **Python detected** (pyproject.toml, requirements.txt, setup.py, or python/python3 exists): `pip install cldpm` or `pip3 install cldpm`
-   - **Node.js/TypeScript detected** (package.json, tsconfig.json, or node/npm exists): `npm install -g cldpm`
-   - **Default**: `pip install cldpm` or `pip3 install cldpm`
+{_INSTALL_BLOCK_PY_FIRST}
 
 ## Structure
 
-- `{shared_dir}/` - Shared components (use `cldpm create`)
-- `{projects_dir}/` - Projects (use `cldpm create project`)
+- `{{shared_dir}}/` - Shared components (use `cldpm create`)
+- `{{projects_dir}}/` - Projects (use `cldpm create project`)
 {CLDPM_SECTION_END}
 """
 
 
-def get_windsurfrules_content(repo_name: str, projects_dir: str, shared_dir: str) -> str:
-    """Get content for .windsurfrules file."""
-    return f"""{CLDPM_SECTION_START}
+@lru_cache(maxsize=32)
+def get_clinerules_content(_repo_name: str, projects_dir: str, shared_dir: str) -> str:
+    """Get content for .clinerules file."""
+    return _CLINERULES_TEMPLATE.format(projects_dir=projects_dir, shared_dir=shared_dir)
+
+
+_WINDSURFRULES_TEMPLATE = f"""{CLDPM_SECTION_START}
 # CLDPM Mono Repo - EXECUTE CLI COMMANDS
 
 **IMPORTANT**: This repo is managed by CLDPM. Always execute `cldpm` commands instead of manually editing files.
@@ -188,21 +219,13 @@ cldpm sync --all                     # Execute for: "fix links", "after clone"
 ## Structure
 
 ```
-{repo_name}/
+{{repo_name}}/
 ├── cldpm.json          # Config (managed by cldpm)
-├── {shared_dir}/       # Shared components
-└── {projects_dir}/     # Projects
+├── {{shared_dir}}/       # Shared components
+└── {{projects_dir}}/     # Projects
 ```
 
-## Installation
-
-**BEFORE running `cldpm` commands**, check if installed and install if needed:
-
-1. **Check**: `which cldpm` or `cldpm --version`
-2. **If missing, detect environment and install**:
-   - **Python detected** (pyproject.toml, requirements.txt, setup.py, or python/python3 exists): `pip install cldpm` or `pip3 install cldpm`
-   - **Node.js/TypeScript detected** (package.json, tsconfig.json, or node/npm exists): `npm install -g cldpm`
-   - **Default**: `pip install cldpm` or `pip3 install cldpm`
+{_INSTALL_BLOCK_PY_FIRST}
 
 ## Rules
 - NEVER manually edit project.json or skill.json
@@ -211,9 +234,15 @@ cldpm sync --all                     # Execute for: "fix links", "after clone"
 """
 
 
-def get_copilot_instructions_content(_repo_name: str, projects_dir: str, shared_dir: str) -> str:
-    """Get content for .github/copilot-instructions.md file."""
-    return f"""{CLDPM_SECTION_START}
+@lru_cache(maxsize=32)
+def get_windsurfrules_content(repo_name: str, projects_dir: str, shared_dir: str) -> str:
+    """Get content for .windsurfrules file."""
+    return _WINDSURFRULES_TEMPLATE.format(
+        repo_name=repo_name, projects_dir=projects_dir, shared_dir=shared_dir
+    )
+
+
+_COPILOT_INSTRUCTIONS_TEMPLATE = f"""{CLDPM_SECTION_START}
 # CLDPM Mono Repo - GitHub Copilot Instructions
 
 This repository uses **CLDPM (Claude Project Manager)**. When suggesting code or actions, use the `cldpm` CLI.
@@ -237,18 +266,10 @@ When the user asks for project management tasks, suggest and execute these comma
 
 - `cldpm.json` - Root config (DO NOT manually edit)
 - `project.json` - Project manifest (managed by cldpm)
-- `{shared_dir}/` - Shared components
-- `{projects_dir}/` - Individual projects
+- `{{shared_dir}}/` - Shared components
+- `{{projects_dir}}/` - Individual projects
 
-## Installation
-
-**BEFORE running `cldpm` commands**, check if installed and install if needed:
-
-1. **Check**: `which cldpm` or `cldpm --version`
-2. **If missing, detect environment and install**:
-   - **Node.js/TypeScript detected** (node/npm exists): `npm install -g cldpm`
-   - **Python detected** (python/python3 exists): `pip install cldpm` or `pip3 install cldpm`
-   - **Priority**: First try Node.js/TypeScript, then Python
+{_INSTALL_BLOCK_NODE_FIRST}
 
 ## Important Rules
 
@@ -259,9 +280,14 @@ When the user asks for project management tasks, suggest and execute these comma
 """
 
 
-def get_claude_md_section() -> str:
-    """Get CLDPM section content for CLAUDE.md."""
-    return f"""
+@lru_cache(maxsize=32)
+def get_copilot_instructions_content(_repo_name: str, projects_dir: str, shared_dir: str) -> str:
+    """Get content for .github/copilot-instructions.md file."""
+    return _COPILOT_INSTRUCTIONS_TEMPLATE.format(projects_dir=projects_dir, shared_dir=shared_dir)
+
+
+# The CLAUDE.md section takes no parameters, so it is built once at import
+_CLAUDE_MD_SECTION = f"""
 {CLDPM_SECTION_START}
 ## CLDPM Commands - EXECUTE THESE
 
@@ -284,22 +310,17 @@ cldpm sync --all                    # Run for: "fix symlinks", "after clone"
 
 **IMPORTANT**: Always use `cldpm` commands. Never manually edit project.json or create symlinks.
 
-## Installation
-
-**BEFORE running `cldpm` commands**, check if installed and install if needed:
-
-1. **Check**: `which cldpm` or `cldpm --version`
-2. **If missing, detect environment and install**:
-   - **Python detected** (pyproject.toml, requirements.txt, setup.py, or python/python3 exists): `pip install cldpm` or `pip3 install cldpm`
-   - **Node.js/TypeScript detected** (package.json, tsconfig.json, or node/npm exists): `npm install -g cldpm`
-   - **Default**: `pip install cldpm` or `pip3 install cldpm`
+{_INSTALL_BLOCK_PY_FIRST}
 {CLDPM_SECTION_END}
 """
 
 
-def get_claude_md_content(repo_name: str) -> str:
-    """Get full CLAUDE.md content for new repos."""
-    return f"""# {repo_name}
+def get_claude_md_section() -> str:
+    """Get CLDPM section content for CLAUDE.md."""
+    return _CLAUDE_MD_SECTION
+
+
+_CLAUDE_MD_TEMPLATE = f"""# {{repo_name}}
 
 This is a CLDPM-managed mono repo for Claude Code projects.
 
@@ -327,40 +348,13 @@ cldpm get my-project
 # After git clone, restore symlinks
 cldpm sync --all
 ```
+{_CLAUDE_MD_SECTION}"""
 
-{CLDPM_SECTION_START}
-## CLDPM Commands - EXECUTE THESE
-
-This project uses CLDPM. **Run these commands** for project management:
-
-```bash
-# Creating
-cldpm create project <name>         # Run for: "create project"
-cldpm create skill <name>           # Run for: "create skill"
-
-# Managing
-cldpm add skill:<name> --to <proj>  # Run for: "add skill to project"
-cldpm remove skill:<name> --from <proj>  # Run for: "remove skill"
-
-# Viewing
-cldpm get <project>                 # Run for: "show project", "project info"
-cldpm get <project> --download      # Run for: "export project"
-cldpm sync --all                    # Run for: "fix symlinks", "after clone"
-```
-
-**IMPORTANT**: Always use `cldpm` commands. Never manually edit project.json or create symlinks.
 
-## Installation
-
-**BEFORE running `cldpm` commands**, check if installed and install if needed:
-
-1. **Check**: `which cldpm` or `cldpm --version`
-2. **If missing, detect environment and install**:
-   - **Python detected** (pyproject.toml, requirements.txt, setup.py, or python/python3 exists): `pip install cldpm` or `pip3 install cldpm`
-   - **Node.js/TypeScript detected** (package.json, tsconfig.json, or node/npm exists): `npm install -g cldpm`
-   - **Default**: `pip install cldpm` or `pip3 install cldpm`
-{CLDPM_SECTION_END}
-"""
+@lru_cache(maxsize=32)
+def get_claude_md_content(repo_name: str) -> str:
+    """Get full CLAUDE.md content for new repos."""
+    return _CLAUDE_MD_TEMPLATE.format(repo_name=repo_name)
 
 
 def create_ai_rules(
@@ -381,37 +375,42 @@ def create_ai_rules(
     If files already exist and contain CLDPM sections, updates those sections.
     Otherwise appends CLDPM section.
     """
-    # Create .cursor/rules/cldpm.mdc (Cursor's new folder structure)
-    cursor_rules_dir = repo_root / ".cursor" / "rules"
+    # Create parent directories up front so the writers never race on mkdir
+    cursor_rules_dir = repo_root / ".cursor/rules"
     cursor_rules_dir.mkdir(parents=True, exist_ok=True)
-    cursor_rules_file = cursor_rules_dir / "cldpm.mdc"
-    cursor_rules_file.write_text(get_cursorrules_content(repo_name, projects_dir, shared_dir))
-
-    # Create/update .clinerules
-    clinerules_path = repo_root / ".clinerules"
-    _write_or_update(
-        clinerules_path,
-        get_clinerules_content(repo_name, projects_dir, shared_dir),
-        existing,
-    )
-
-    # Create/update .windsurfrules
-    windsurfrules_path = repo_root / ".windsurfrules"
-    _write_or_update(
-        windsurfrules_path,
-        get_windsurfrules_content(repo_name, projects_dir, shared_dir),
-        existing,
-    )
-
-    # Create/update .github/copilot-instructions.md
     github_dir = repo_root / ".github"
     github_dir.mkdir(parents=True, exist_ok=True)
-    copilot_path = github_dir / "copilot-instructions.md"
-    _write_or_update(
-        copilot_path,
-        get_copilot_instructions_content(repo_name, projects_dir, shared_dir),
-        existing,
-    )
+
+    # (path, content, check_existing) for each independent file
+    tasks = [
+        # .cursor/rules/cldpm.mdc (Cursor's new folder structure) is always overwritten
+        (
+            cursor_rules_dir / "cldpm.mdc",
+            get_cursorrules_content(repo_name, projects_dir, shared_dir),
+            False,
+        ),
+        (
+            repo_root / ".clinerules",
+            get_clinerules_content(repo_name, projects_dir, shared_dir),
+            existing,
+        ),
+        (
+            repo_root / ".windsurfrules",
+            get_windsurfrules_content(repo_name, projects_dir, shared_dir),
+            existing,
+        ),
+        (
+            github_dir / "copilot-instructions.md",
+            get_copilot_instructions_content(repo_name, projects_dir, shared_dir),
+            existing,
+        ),
+    ]
+
+    # The files are independent, so overlap their I/O
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = [executor.submit(_write_or_update, *task) for task in tasks]
+    for future in futures:
+        future.result()
 
 
 def append_to_claude_md(claude_md_path: Path) -> None:
@@ -419,35 +418,78 @@ def append_to_claude_md(claude_md_path: Path) -> None:
     if not claude_md_path.exists():
         return
 
-    content = claude_md_path.read_text()
-    new_section = get_claude_md_section()
-
-    # Check for existing CLDPM section (new or legacy markers)
-    if CLDPM_SECTION_START in content:
-        # Update existing section
-        updated = _replace_section(content, new_section)
-        claude_md_path.write_text(updated)
-    elif CLDPM_SECTION_MARKER in content:
-        # Update legacy section
-        pattern = re.compile(
-            re.escape(CLDPM_SECTION_MARKER) + r".*?" + re.escape(CLDPM_SECTION_MARKER),
-            re.DOTALL
-        )
-        updated = pattern.sub(new_section.strip(), content)
-        claude_md_path.write_text(updated)
-    else:
+    new_section = _encode(get_claude_md_section())
+
+    def _update(content: bytes) -> bytes:
+        # Check for existing CLDPM section (new or legacy markers); the
+        # offsets found here are reused for the replacement
+        start = content.find(_SECTION_START_BYTES)
+        if start >= 0:
+            # Update existing section
+            return _replace_section(content, new_section, start)
+        start = content.find(_SECTION_MARKER_BYTES)
+        if start >= 0:
+            # Update legacy section
+            return _replace_between(
+                content,
+                _SECTION_MARKER_BYTES,
+                _SECTION_MARKER_BYTES,
+                new_section.strip(),
+                start,
+            )
         # Append new section
-        with open(claude_md_path, "a") as f:
-            f.write(new_section)
+        return content + new_section
 
+    _rewrite(claude_md_path, _update)
 
-def _replace_section(content: str, new_section: str) -> str:
+
+def _replace_section(
+    content: bytes, new_section: bytes, start_index: Optional[int] = None
+) -> bytes:
     """Replace existing CLDPM section with new content."""
-    pattern = re.compile(
-        re.escape(CLDPM_SECTION_START) + r".*?" + re.escape(CLDPM_SECTION_END),
-        re.DOTALL
+    return _replace_between(
+        content, _SECTION_START_BYTES, _SECTION_END_BYTES, new_section.strip(), start_index
     )
-    return pattern.sub(new_section.strip(), content)
+
+
+def _replace_between(
+    content: AnyStr,
+    start: AnyStr,
+    end: AnyStr,
+    replacement: AnyStr,
+    start_index: Optional[int] = None,
+) -> AnyStr:
+    """Replace the first ``start``...``end`` span (markers included) with replacement.
+
+    The markers are plain literals, so a substring search is enough. Callers that
+    already located ``start`` pass its offset as ``start_index`` to skip a rescan.
+    """
+    i = content.find(start) if start_index is None else start_index
+    if i < 0:
+        return content
+    j = content.find(end, i + len(start))
+    if j < 0:
+        return content
+    return content[:i] + replacement + content[j + len(end):]
+
+
+def _rewrite(path: Path, transform: Callable[[bytes], bytes]) -> None:
+    """Rewrite a file through ``transform``, writing only what changed.
+
+    Works on raw bytes so the content is never decoded. The file is only
+    opened for writing when ``transform`` changes its content, so
+    unchanged (possibly read-only) files are left alone, and appends
+    write just the added tail.
+    """
+    old = path.read_bytes()
+    new = transform(old)
+    if new == old:
+        return
+    if new.startswith(old):
+        with open(path, "ab") as f:
+            f.write(new[len(old):])
+        return
+    path.write_bytes(new)
 
 
 def _write_or_update(
@@ -456,20 +498,56 @@ def _write_or_update(
     check_existing: bool,
 ) -> None:
     """Write content to file, update existing section, or append if file exists."""
+    data = _encode(content)
     if check_existing and path.exists():
-        existing_content = path.read_text()
-
-        if CLDPM_SECTION_START in existing_content:
-            # Update existing CLDPM section
-            updated = _replace_section(existing_content, content)
-            path.write_text(updated)
-        elif "CLDPM" in existing_content:
-            # Has old-style CLDPM content without markers, skip to avoid duplication
-            return
-        else:
+
+        def _update(existing_content: bytes) -> bytes:
+            start = existing_content.find(_SECTION_START_BYTES)
+            if start >= 0:
+                # Update existing CLDPM section
+                return _replace_section(existing_content, data, start)
+            if b"CLDPM" in existing_content:
+                # Has old-style CLDPM content without markers, skip to avoid duplication
+                return existing_content
             # Append new section
-            with open(path, "a") as f:
-                f.write("\n\n")
-                f.write(content)
+            return existing_content + b"\n\n" + data
+
+        _rewrite(path, _update)
     else:
-        path.write_text(content)
+        _write_if_changed(path, data)
+
+
+@lru_cache(maxsize=32)
+def _encode(content: str) -> bytes:
+    """UTF-8 encode generated content.
+
+    The generators are memoized and return the same string objects, so the
+    encoded form is cached alongside them.
+    """
+    return content.encode("utf-8")
+
+
+def _write_if_changed(path: Path, data: bytes) -> None:
+    """Write data to a file unless it already holds exactly that data."""
+    try:
+        if path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    _write_bytes(path, data)
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write pre-encoded data to a file through a raw file descriptor.
+
+    Skips the text and buffering layers of ``Path.write_text``; for the few KB
+    written here this is a single ``write`` call.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
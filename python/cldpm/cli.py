@@ -1,11 +1,30 @@
 """CLI entry point for CLDPM."""
 
+import importlib
+from typing import Optional
+
 import click
 
-from .commands import init, create, add, remove, link, unlink, get, sync
+from . import commands
 from ._banner import print_banner
 
 
+class LazyGroup(click.Group):
+    """Click group that imports the package commands only when needed."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *commands.__all__})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        # Read the command off its submodule; the package attribute of the
+        # same name can be the submodule itself once it has been imported
+        module_name = commands._COMMAND_MODULES.get(cmd_name)
+        if module_name is not None:
+            module = importlib.import_module(module_name, commands.__name__)
+            return getattr(module, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
 def show_version(ctx: click.Context, param: click.Parameter, value: bool) -> None:
     """Custom version callback that shows banner."""
     if not value or ctx.resilient_parsing:
@@ -14,7 +33,7 @@ def show_version(ctx: click.Context, param: click.Parameter, value: bool) -> Non
     ctx.exit()
 
 
-@click.group()
+@click.group(cls=LazyGroup)
 @click.option(
     "--version", "-v",
     is_flag=True,
@@ -51,17 +70,6 @@ def cli() -> None:
     pass
 
 
-# Register commands
-cli.add_command(init)
-cli.add_command(create)
-cli.add_command(add)
-cli.add_command(remove)
-cli.add_command(link)
-cli.add_command(unlink)
-cli.add_command(get)
-cli.add_command(sync)
-
-
 @cli.command()
 def info() -> None:
     """Show CLDPM information banner.
@@ -1,11 +1,45 @@
 """CLI commands for CLDPM."""
 
-from .init import init
-from .create import create
-from .add import add
-from .remove import remove
-from .link import link, unlink
-from .get import get
-from .sync import sync
+import importlib
+import sys
+from types import ModuleType
+
+# Command name -> defining submodule. Commands are imported on first
+# attribute access so running one command does not load all the others.
+_COMMAND_MODULES = {
+    "init": ".init",
+    "create": ".create",
+    "add": ".add",
+    "remove": ".remove",
+    "link": ".link",
+    "unlink": ".link",
+    "get": ".get",
+    "sync": ".sync",
+}
 
 __all__ = ["init", "create", "add", "remove", "link", "unlink", "get", "sync"]
+
+
+def __getattr__(name: str):
+    """Import a command from its submodule on first access (PEP 562)."""
+    try:
+        module_name = _COMMAND_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    command = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = command
+    return command
+
+
+class _CommandsModule(ModuleType):
+    """Package module that keeps command names bound to the commands."""
+
+    def __setattr__(self, name: str, value: object) -> None:
+        # Importing a submodule binds it on the package under its own name,
+        # which would shadow the command of the same name (e.g. ``get``)
+        if name in _COMMAND_MODULES and isinstance(value, ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _CommandsModule
@@ -1,24 +1,54 @@
 """Implementation of cldpm create command."""
 
 import json
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
-from jinja2 import Environment, PackageLoader
 
-from ..schemas import ComponentDependencies, ComponentMetadata, ProjectConfig, ProjectDependencies
+from ..schemas import (
+    ComponentDependencies,
+    ComponentMetadata,
+    ProjectConfig,
+    ProjectDependencies,
+)
 from ..core.config import load_cldpm_config, save_project_config
-from ..core.linker import sync_project_links
-from ..utils.fs import ensure_dir, find_repo_root
+from ..utils.fs import find_repo_root
 from ..utils.output import print_success, print_error, print_dir_tree, console
+from ..utils.templates import get_template, get_template_env
+
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+
+@lru_cache(maxsize=None)
+def _get_component_template(singular_type: str) -> "Template":
+    """Get the template for a component type, falling back to the generic one."""
+    return get_template_env().select_template([f"{singular_type}.md.j2", "generic.md.j2"])
+
+
+# Singular names and content files for each component type (skills -> skill)
+_SINGULAR = {"skills": "skill", "agents": "agent", "hooks": "hook", "rules": "rule"}
+_CONTENT_FILENAMES = {
+    component_type: f"{singular.upper()}.md" for component_type, singular in _SINGULAR.items()
+}
+
+# json.dumps builds a new encoder per call whenever indent is set
+_JSON_ENCODER = json.JSONEncoder(indent=2)
 
 
 def parse_dependency_list(deps_str: Optional[str]) -> list[str]:
     """Parse a comma-separated dependency string into a list."""
     if not deps_str:
         return []
-    return [d.strip() for d in deps_str.split(",") if d.strip()]
+    deps = []
+    for dep in deps_str.split(","):
+        dep = dep.strip()
+        if dep:
+            deps.append(dep)
+    return deps
 
 
 def save_component_metadata(
@@ -33,7 +63,7 @@ def save_component_metadata(
         component_path: Path to the component directory.
         component_type: Type of component (skills, agents, hooks, rules).
     """
-    singular_type = component_type.rstrip("s")  # skills -> skill
+    singular_type = _SINGULAR[component_type]
     metadata_path = component_path / f"{singular_type}.json"
 
     data = {"name": metadata.name}
@@ -42,20 +72,21 @@ def save_component_metadata(
 
     # Only include dependencies if any exist
     deps = metadata.dependencies
-    if deps.skills or deps.agents or deps.hooks or deps.rules:
-        data["dependencies"] = {}
-        if deps.skills:
-            data["dependencies"]["skills"] = deps.skills
-        if deps.agents:
-            data["dependencies"]["agents"] = deps.agents
-        if deps.hooks:
-            data["dependencies"]["hooks"] = deps.hooks
-        if deps.rules:
-            data["dependencies"]["rules"] = deps.rules
-
-    with open(metadata_path, "w") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    dependencies = {
+        dep_type: dep_names
+        for dep_type, dep_names in (
+            ("skills", deps.skills),
+            ("agents", deps.agents),
+            ("hooks", deps.hooks),
+            ("rules", deps.rules),
+        )
+        if dep_names
+    }
+    if dependencies:
+        data["dependencies"] = dependencies
+
+    # Small file: serialize once and write it in a single call
+    metadata_path.write_bytes(_JSON_ENCODER.encode(data).encode("utf-8") + b"\n")
 
 
 @click.group()
@@ -111,9 +142,10 @@ def project(
     # Parse dependencies
     deps = ProjectDependencies()
     if skills:
-        deps.skills = [s.strip() for s in skills.split(",") if s.strip()]
+        deps.skills = parse_dependency_list(skills)
     if agents:
-        deps.agents = [a.strip() for a in agents.split(",") if a.strip()]
+        deps.agents = parse_dependency_list(agents)
+    has_deps = bool(deps.skills or deps.agents)
 
     # Create project config
     project_config = ProjectConfig(
@@ -123,40 +155,41 @@ def project(
     )
     project_path = repo_root / cldpm_config.projects_dir / project_config.id
 
-    if project_path.exists():
+    # A single mkdir both checks for and creates the project directory
+    try:
+        project_path.mkdir(parents=True)
+    except FileExistsError:
         print_error(f"Project already exists: {project_config.id}")
         raise SystemExit(1)
 
-    ensure_dir(project_path)
-    save_project_config(project_config, project_path)
-
     # Create .claude directory structure
     claude_dir = project_path / ".claude"
-    ensure_dir(claude_dir)
-    ensure_dir(claude_dir / "skills")
-    ensure_dir(claude_dir / "agents")
-    ensure_dir(claude_dir / "hooks")
-    ensure_dir(claude_dir / "rules")
-
-    # Create settings.json placeholder
-    (claude_dir / "settings.json").write_text("{}\n")
+    for component_type in ("skills", "agents", "hooks", "rules"):
+        (claude_dir / component_type).mkdir(parents=True, exist_ok=True)
 
     # Create outputs directory
-    ensure_dir(project_path / "outputs")
+    (project_path / "outputs").mkdir(exist_ok=True)
+
+    save_project_config(project_config, project_path)
+
+    # Create settings.json placeholder
+    (claude_dir / "settings.json").write_bytes(b"{}\n")
 
     # Create CLAUDE.md from template
-    env = Environment(loader=PackageLoader("cldpm", "templates"))
-    template = env.get_template("CLAUDE.md.j2")
-    claude_md = template.render(
-        project_name=name,
-        description=description or "",
-    )
-    (project_path / "CLAUDE.md").write_text(claude_md)
+    template = get_template("CLAUDE.md.j2")
+    with open(project_path / "CLAUDE.md", "wb") as f:
+        template.stream(
+            project_name=name,
+            description=description or "",
+        ).dump(f, encoding="utf-8")
 
     print_success(f"Created project: {project_config.id}")
 
     # Sync symlinks if dependencies were specified
-    if deps.skills or deps.agents:
+    if has_deps:
+        # Only projects with dependencies need the linker
+        from ..core.linker import sync_project_links
+
         result = sync_project_links(project_path, repo_root)
         if result["created"]:
             console.print(f"  Linked: {', '.join(result['created'])}")
@@ -331,12 +364,13 @@ def _create_component(
     # Create component directory
     component_path = repo_root / cldpm_config.shared_dir / component_type / name
 
-    if component_path.exists():
+    # A single mkdir both checks for and creates the component directory
+    try:
+        component_path.mkdir(parents=True)
+    except FileExistsError:
         print_error(f"Component already exists: {component_type}/{name}")
         raise SystemExit(1)
 
-    ensure_dir(component_path)
-
     # Parse dependencies
     deps = ComponentDependencies(
         skills=parse_dependency_list(skills),
@@ -354,37 +388,16 @@ def _create_component(
     save_component_metadata(metadata, component_path, component_type)
 
     # Create content file from template
-    singular_type = component_type.rstrip("s")  # skills -> skill
-    content_filename = f"{singular_type.upper()}.md"
-
-    env = Environment(loader=PackageLoader("cldpm", "templates"))
-
-    # Try to load component-specific template, fall back to generic
-    try:
-        template = env.get_template(f"{singular_type}.md.j2")
-    except Exception:
-        # Use generic template
-        template_content = f"""# {name}
+    singular_type = _SINGULAR[component_type]
+    content_filename = _CONTENT_FILENAMES[component_type]
 
-{description or f"A shared {singular_type}."}
-
-## Overview
-
-Describe what this {singular_type} does.
-
-## Usage
-
-Explain how to use this {singular_type}.
-"""
-        (component_path / content_filename).write_text(template_content)
-        _print_component_success(component_type, name, deps, component_path)
-        return
-
-    content = template.render(
-        name=name,
-        description=description or "",
-    )
-    (component_path / content_filename).write_text(content)
+    template = _get_component_template(singular_type)
+    with open(component_path / content_filename, "wb") as f:
+        template.stream(
+            name=name,
+            description=description or "",
+            singular_type=singular_type,
+        ).dump(f, encoding="utf-8")
 
     _print_component_success(component_type, name, deps, component_path)
 
@@ -396,19 +409,16 @@ def _print_component_success(
     component_path: Path,
 ) -> None:
     """Print success message for component creation."""
-    singular_type = component_type.rstrip("s")
+    singular_type = _SINGULAR[component_type]
     print_success(f"Created {singular_type}: {name}")
 
     # Show dependencies if any
-    all_deps = []
-    if deps.skills:
-        all_deps.extend([f"skills/{s}" for s in deps.skills])
-    if deps.agents:
-        all_deps.extend([f"agents/{a}" for a in deps.agents])
-    if deps.hooks:
-        all_deps.extend([f"hooks/{h}" for h in deps.hooks])
-    if deps.rules:
-        all_deps.extend([f"rules/{r}" for r in deps.rules])
+    all_deps = list(chain(
+        (f"skills/{s}" for s in deps.skills),
+        (f"agents/{a}" for a in deps.agents),
+        (f"hooks/{h}" for h in deps.hooks),
+        (f"rules/{r}" for r in deps.rules),
+    ))
 
     if all_deps:
         console.print(f"  Dependencies: {', '.join(all_deps)}")
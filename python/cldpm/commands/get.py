@@ -1,45 +1,304 @@
 """Implementation of cldpm get command."""
 
+import errno
 import json
+import os
 import shutil
-import subprocess
+import stat
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Optional, TypeVar, Union
 
 import click
 
-
-def _find_component_path(base_dir: Path, dep_type: str, dep_name: str) -> Optional[Path]:
-    """Find a component path, checking both directory and file variants.
-
-    Components can be directories (e.g., shared/skills/logging/) or
-    files (e.g., shared/skills/new-skill.md). This function checks
-    the exact path first, then looks for file matches with extensions.
-    """
-    exact = base_dir / dep_type / dep_name
-    if exact.exists():
-        return exact
-    # Look for file with extension (e.g., new-skill.md)
-    parent = base_dir / dep_type
-    if parent.exists():
-        for item in parent.iterdir():
-            if item.stem == dep_name and item.is_file():
-                return item
-    return None
-
 from ..core.config import load_cldpm_config
 from ..core.resolver import resolve_project
+from ..schemas import CldpmConfig
 from ..utils.fs import ensure_dir, find_repo_root
-from ..utils.git import (
-    cleanup_temp_dir,
-    clone_to_temp,
-    get_github_token,
-    has_sparse_clone_support,
-    parse_repo_url,
-    sparse_clone_to_temp,
-)
 from ..utils.output import console, print_error, print_success, print_tree, print_warning
 
+# Component directories under .claude/, in display order
+_COMPONENT_TYPES = ("skills", "agents", "hooks", "rules")
+_COMPONENT_TYPES_SET = frozenset(_COMPONENT_TYPES)
+
+# Shared encoder for --format json output
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+_T = TypeVar("_T")
+
+# Copies a single file; called with (source, dest) like shutil.copy
+CopyFunction = Callable[[Union[str, Path], Path], object]
+
+
+def _fast_copy(source: Union[str, Path], dest: Path) -> object:
+    """Copy a file like ``shutil.copy``, letting the kernel clone it if it can.
+
+    ``os.copy_file_range`` (Linux) copies without leaving the kernel and,
+    on reflink-capable filesystems such as btrfs and XFS, shares extents
+    instead of duplicating data. Anything but a regular file, and any
+    pair of files it refuses or copies nothing for (old kernels,
+    cross-filesystem, some filesystems), goes through ``shutil.copy``.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return shutil.copy(source, dest)
+    # Check before opening: opening a FIFO for reading blocks on a writer
+    st = os.stat(source)
+    if not stat.S_ISREG(st.st_mode):
+        return shutil.copy(source, dest)
+    try:
+        with open(source, "rb") as fsrc, open(dest, "wb") as fdst:
+            copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30)
+            if not copied and st.st_size:
+                # Some kernels and filesystems report 0 without copying
+                raise OSError(errno.ENOTSUP, "copy_file_range copied nothing")
+            while copied:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30)
+    except OSError:
+        return shutil.copy(source, dest)
+    shutil.copymode(source, dest)
+    return dest
+
+
+def _link_or_copy(source: Union[str, Path], dest: Path) -> object:
+    """Hard-link a file, falling back to a copy if linking fails.
+
+    Linking fails across filesystems (EXDEV) and on filesystems without
+    hard link support, in which case the bytes are copied as usual.
+    """
+    try:
+        os.link(source, dest)
+    except OSError:
+        return _fast_copy(source, dest)
+    return dest
+
+
+def _copy_tree(
+    source: Union[str, Path], dest: Path, copy_file: CopyFunction = _fast_copy
+) -> None:
+    """Copy a directory tree, keeping permission bits but not timestamps.
+
+    The default copy function moves the bytes through a kernel fast path
+    like ``copy2`` but skips the per-file ``copystat`` (utime and xattr
+    calls). Modes are still copied so executable hooks stay executable.
+    """
+    shutil.copytree(source, dest, copy_function=copy_file)
+
+
+def _copy_project_files(
+    source: Path, target: Path, copy_file: CopyFunction = _fast_copy
+) -> dict[str, int]:
+    """Copy a project's files, leaving out symlinked shared components.
+
+    Uses ``os.scandir`` so the name and type checks reuse the directory
+    entry instead of issuing extra ``stat`` calls per item.
+
+    Returns:
+        The number of local components copied, by component type.
+    """
+    local_counts = dict.fromkeys(_COMPONENT_TYPES, 0)
+    with os.scandir(source) as entries:
+        for item in entries:
+            dest = target / item.name
+
+            if item.name == ".claude":
+                # Handle .claude directory specially; the target is new, so
+                # a plain mkdir is enough
+                os.mkdir(dest)
+                local_counts = _copy_claude_dir(item.path, dest, copy_file)
+            elif item.is_dir():
+                _copy_tree(item.path, dest, copy_file)
+            else:
+                copy_file(item.path, dest)
+    return local_counts
+
+
+def _copy_claude_dir(
+    source: str, dest: Path, copy_file: CopyFunction = _fast_copy
+) -> dict[str, int]:
+    """Copy a project's .claude directory without symlinked components.
+
+    Returns:
+        The number of local components copied, by component type.
+    """
+    local_counts = dict.fromkeys(_COMPONENT_TYPES, 0)
+    with os.scandir(source) as entries:
+        for claude_item in entries:
+            claude_dest = dest / claude_item.name
+
+            if claude_item.name in _COMPONENT_TYPES_SET:
+                # Create directory
+                os.mkdir(claude_dest)
+
+                # Copy local (non-symlink) components directly
+                with os.scandir(claude_item.path) as components:
+                    for comp_item in components:
+                        if comp_item.name == ".gitignore":
+                            continue  # Skip .gitignore
+                        if not comp_item.is_symlink():
+                            comp_dest = claude_dest / comp_item.name
+                            if comp_item.is_dir(follow_symlinks=False):
+                                _copy_tree(comp_item.path, comp_dest, copy_file)
+                            else:
+                                copy_file(comp_item.path, comp_dest)
+                            local_counts[claude_item.name] += 1
+            elif claude_item.is_file():
+                copy_file(claude_item.path, claude_dest)
+            elif claude_item.is_dir():
+                _copy_tree(claude_item.path, claude_dest, copy_file)
+    return local_counts
+
+
+def _copy_shared_components(
+    shared_dir: Path,
+    target: Path,
+    dependencies: dict[str, list[str]],
+    copy_file: CopyFunction = _fast_copy,
+) -> None:
+    """Copy shared components into ``target/.claude/<type>/``.
+
+    Symlinks are resolved so the result is self-contained. Each type
+    directory is created once up front rather than checked per component,
+    and the components themselves are copied concurrently.
+    """
+    # Collect the copies first, keyed by target so each is done only once.
+    # Source and target directories are each listed once per type instead
+    # of stat-ing every component.
+    copies: dict[Path, os.DirEntry] = {}
+    claude_dir = target / ".claude"
+    for dep_type in _COMPONENT_TYPES:
+        dep_names = dependencies.get(dep_type)
+        if not dep_names:
+            continue
+        type_dir = claude_dir / dep_type
+        components = _index_components(shared_dir / dep_type)
+        # Usually created by the project copy already; only make it if not
+        try:
+            existing = set(os.listdir(type_dir))
+        except FileNotFoundError:
+            os.makedirs(type_dir)
+            existing = set()
+
+        for dep_name in dep_names:
+            source_comp = components.get(dep_name)
+            if source_comp is None or source_comp.name in existing:
+                continue
+            copies.setdefault(type_dir / source_comp.name, source_comp)
+
+    def _copy(target_comp: Path, source_comp: os.DirEntry) -> None:
+        if source_comp.is_dir():
+            _copy_tree(source_comp.path, target_comp, copy_file)
+        else:
+            copy_file(source_comp.path, target_comp)
+
+    if len(copies) <= 1:
+        for target_comp, source_comp in copies.items():
+            _copy(target_comp, source_comp)
+        return
+
+    # Component copies are independent and I/O-bound
+    with ThreadPoolExecutor(max_workers=min(32, len(copies))) as executor:
+        futures = [executor.submit(_copy, *item) for item in copies.items()]
+    for future in futures:
+        future.result()
+
+
+def _shared_names(resolved: dict) -> dict[str, list[str]]:
+    """Map each component type to the shared component names it resolved."""
+    shared = resolved["shared"]
+    return {
+        dep_type: [component["name"] for component in shared.get(dep_type, ())]
+        for dep_type in _COMPONENT_TYPES
+    }
+
+
+def _component_counts(components: dict) -> dict[str, int]:
+    """Count the components of each type in a type -> components mapping."""
+    return {dep_type: len(components.get(dep_type, ())) for dep_type in _COMPONENT_TYPES}
+
+
+def _prepare_target(output_dir: Optional[str], default_name: str) -> Path:
+    """Create the directory a project is downloaded into.
+
+    Uses ``output_dir`` if given, otherwise ``default_name`` under the
+    current directory. Exits with an error if the target already exists.
+    """
+    if output_dir:
+        # The target does not exist yet, so there are no symlinks to
+        # resolve; abspath normalizes the path without any syscalls
+        target = Path(os.path.abspath(output_dir))
+    else:
+        target = Path.cwd() / default_name
+
+    if target.exists():
+        print_error(f"Target directory already exists: {target}")
+        raise SystemExit(1)
+
+    ensure_dir(target)
+    return target
+
+
+def _print_download_counts(
+    shared_counts: dict[str, int], local_counts: dict[str, int]
+) -> None:
+    """Print the non-zero shared and local component counts of a download."""
+    for label, counts in (("Shared", shared_counts), ("Local", local_counts)):
+        deps_str = ", ".join(f"{n} {dep_type}" for dep_type, n in counts.items() if n)
+        if deps_str:
+            console.print(f"  {label}: {deps_str}")
+
+
+def _list_files(dir_path: Union[str, Path]) -> list[str]:
+    """List the names of the files directly inside a directory."""
+    with os.scandir(dir_path) as entries:
+        return [entry.name for entry in entries if entry.is_file()]
+
+
+def _project_paths(project_path: str, shared_dir: str, dependencies: dict) -> list[str]:
+    """List the sparse checkout patterns for a project and its dependencies.
+
+    Includes both directory and file patterns for each dependency since
+    components can be directories (e.g., shared/skills/logging/) or
+    files (e.g., shared/skills/new-skill.md).
+    """
+    all_paths = [project_path]
+    for dep_type in _COMPONENT_TYPES:
+        for dep_name in dependencies.get(dep_type, []):
+            all_paths.append(f"{shared_dir}/{dep_type}/{dep_name}")
+            all_paths.append(f"{shared_dir}/{dep_type}/{dep_name}.*")
+    return all_paths
+
+
+def _index_entries(entries: Iterable[tuple[str, bool, bool, _T]]) -> dict[str, _T]:
+    """Index component candidates by name, given ``(name, is_dir, is_file, value)``.
+
+    Components can be directories (e.g., shared/skills/logging/) or
+    files (e.g., shared/skills/new-skill.md), so each entry is indexed by
+    its full name and each file also by its stem. Full names win over
+    stems, so an exact match is preferred to a file with an extension.
+    Entries that are neither files nor directories are ignored.
+    """
+    by_name: dict[str, _T] = {}
+    by_stem: dict[str, _T] = {}
+    for name, is_dir, is_file, value in entries:
+        if is_dir:
+            by_name[name] = value
+        elif is_file:
+            by_name[name] = value
+            by_stem.setdefault(os.path.splitext(name)[0], value)
+    return {**by_stem, **by_name}
+
+
+def _index_components(type_dir: Path) -> dict[str, os.DirEntry]:
+    """Index a component type directory with a single scandir."""
+    try:
+        with os.scandir(type_dir) as entries:
+            return _index_entries(
+                (entry.name, entry.is_dir(), entry.is_file(), entry) for entry in entries
+            )
+    except FileNotFoundError:
+        return {}
+
 
 @click.command()
 @click.argument("path_or_name")
@@ -75,6 +334,11 @@ from ..utils.output import console, print_error, print_success, print_tree, prin
     "branch_name",
     help="Git branch name (use when branch contains slashes)",
 )
+@click.option(
+    "--hardlink",
+    is_flag=True,
+    help="Hard-link files instead of copying them (local downloads only)",
+)
 def get(
     path_or_name: str,
     output_format: str,
@@ -82,6 +346,7 @@ def get(
     download: bool,
     output_dir: Optional[str],
     branch_name: Optional[str],
+    hardlink: bool,
 ) -> None:
     """Get project info with all components (shared and local).
 
@@ -99,6 +364,12 @@ def get(
       Works for both local and remote repos. Copies the project with
       all dependencies resolved (shared components copied as files).
 
+    \b
+    Hard link option (--hardlink):
+      With -d on a local repo, hard-links files instead of copying them
+      when the output is on the same filesystem. Linked files share
+      content with the repo, so editing one edits both.
+
     \b
     Remote URL formats:
       owner/repo                    - GitHub shorthand
@@ -120,6 +391,7 @@ def get(
       cldpm get my-project -f json              # JSON output
       cldpm get my-project -d                   # Download to ./my-project
       cldpm get my-project -d -o ./copy         # Download to ./copy
+      cldpm get my-project -d --hardlink        # Download as hard links
       cldpm get my-project -r owner/repo        # From remote
       cldpm get my-project -r owner/repo -d     # Download remote
       cldpm get my-project -r owner/repo -b feature/auth  # With branch
@@ -129,7 +401,7 @@ def get(
             path_or_name, output_format, remote_url, download, output_dir, branch_name
         )
     else:
-        _handle_local_get(path_or_name, output_format, download, output_dir)
+        _handle_local_get(path_or_name, output_format, download, output_dir, hardlink)
 
 
 def _handle_local_get(
@@ -137,6 +409,7 @@ def _handle_local_get(
     output_format: str,
     download: bool,
     output_dir: Optional[str],
+    hardlink: bool = False,
 ) -> None:
     """Handle get command for local repositories."""
     # Find repo root
@@ -147,118 +420,52 @@ def _handle_local_get(
 
     # Resolve project
     try:
-        result = resolve_project(path_or_name, repo_root)
+        cldpm_config = load_cldpm_config(repo_root)
+        result = resolve_project(path_or_name, repo_root, cldpm_config)
     except FileNotFoundError as e:
         print_error(str(e))
         raise SystemExit(1)
 
     # Output in requested format
     if output_format == "json":
-        click.echo(json.dumps(result, indent=2))
+        click.echo(_JSON_ENCODER.encode(result))
     else:
         print_tree(result)
 
     # Download if requested
     if download:
-        _download_local_project(result, repo_root, output_dir)
+        _download_local_project(result, repo_root, cldpm_config, output_dir, hardlink)
 
 
 def _download_local_project(
     resolved: dict,
     repo_root: Path,
+    cldpm_config: CldpmConfig,
     output_dir: Optional[str],
+    hardlink: bool = False,
 ) -> None:
     """Download/copy a local project with all dependencies resolved."""
     source_path = Path(resolved["path"])
     project_id = resolved["id"]
 
-    # Determine target directory
-    if output_dir:
-        target_path = Path(output_dir).resolve()
-    else:
-        target_path = Path.cwd() / project_id
-
-    if target_path.exists():
-        print_error(f"Target directory already exists: {target_path}")
-        raise SystemExit(1)
+    target_path = _prepare_target(output_dir, project_id)
 
-    # Create target directory
-    ensure_dir(target_path)
-
-    # Load CLDPM config for shared directory path
-    cldpm_config = load_cldpm_config(repo_root)
     shared_dir = repo_root / cldpm_config.shared_dir
 
-    # Copy project files
-    for item in source_path.iterdir():
-        dest = target_path / item.name
-
-        if item.name == ".claude":
-            # Handle .claude directory specially
-            ensure_dir(dest)
-            for claude_item in item.iterdir():
-                claude_dest = dest / claude_item.name
-
-                if claude_item.name in ["skills", "agents", "hooks", "rules"]:
-                    # Create directory
-                    ensure_dir(claude_dest)
+    copy_file = _link_or_copy if hardlink else _fast_copy
 
-                    # Copy local (non-symlink) components directly
-                    for comp_item in claude_item.iterdir():
-                        if comp_item.name == ".gitignore":
-                            continue  # Skip .gitignore
-                        if not comp_item.is_symlink():
-                            comp_dest = claude_dest / comp_item.name
-                            if comp_item.is_dir():
-                                shutil.copytree(comp_item, comp_dest)
-                            else:
-                                shutil.copy2(comp_item, comp_dest)
-                elif claude_item.is_file():
-                    shutil.copy2(claude_item, claude_dest)
-                elif claude_item.is_dir():
-                    shutil.copytree(claude_item, claude_dest)
-        elif item.is_dir():
-            shutil.copytree(item, dest, symlinks=False)
-        else:
-            shutil.copy2(item, dest)
+    # Copy project files
+    _copy_project_files(source_path, target_path, copy_file)
 
     # Copy shared dependencies (resolve symlinks to actual files)
-    for dep_type in ["skills", "agents", "hooks", "rules"]:
-        for component in resolved["shared"].get(dep_type, []):
-            comp_name = component["name"]
-            source_comp = _find_component_path(shared_dir, dep_type, comp_name)
-            if source_comp is None:
-                continue
-            target_comp = target_path / ".claude" / dep_type / source_comp.name
-
-            if not target_comp.exists():
-                if source_comp.is_dir():
-                    shutil.copytree(source_comp, target_comp)
-                else:
-                    shutil.copy2(source_comp, target_comp)
-
-    # Count what was copied
-    shared_counts = {
-        dep_type: len(resolved["shared"].get(dep_type, []))
-        for dep_type in ["skills", "agents", "hooks", "rules"]
-    }
-    local_counts = {
-        dep_type: len(resolved["local"].get(dep_type, []))
-        for dep_type in ["skills", "agents", "hooks", "rules"]
-    }
+    _copy_shared_components(
+        shared_dir, target_path, _shared_names(resolved), copy_file
+    )
 
     print_success(f"Downloaded to {target_path}")
-
-    non_zero_shared = {k: v for k, v in shared_counts.items() if v > 0}
-    non_zero_local = {k: v for k, v in local_counts.items() if v > 0}
-
-    if non_zero_shared:
-        deps_str = ", ".join(f"{v} {k}" for k, v in non_zero_shared.items())
-        console.print(f"  Shared: {deps_str}")
-
-    if non_zero_local:
-        deps_str = ", ".join(f"{v} {k}" for k, v in non_zero_local.items())
-        console.print(f"  Local: {deps_str}")
+    _print_download_counts(
+        _component_counts(resolved["shared"]), _component_counts(resolved["local"])
+    )
 
 
 def _handle_remote_get(
@@ -270,6 +477,8 @@ def _handle_remote_get(
     branch_name: Optional[str] = None,
 ) -> None:
     """Handle get command for remote repositories."""
+    from ..utils.git import get_github_token, has_sparse_clone_support, parse_repo_url
+
     # Get GitHub token
     token = get_github_token()
     if not token:
@@ -287,6 +496,13 @@ def _handle_remote_get(
     # Use explicit branch if provided, otherwise use branch from URL
     branch = branch_name if branch_name else url_branch
 
+    # Without --download only metadata is needed, which GitHub can serve
+    # through its API without cloning at all
+    if not download and _handle_remote_get_api(
+        path_or_name, output_format, remote_url, repo_url, branch, token
+    ):
+        return
+
     # Check if sparse clone is supported
     use_sparse = has_sparse_clone_support()
 
@@ -295,12 +511,178 @@ def _handle_remote_get(
             path_or_name, output_format, remote_url, download, output_dir,
             repo_url, branch, token
         )
+        return
+
+    # Without sparse checkout, a GitHub tarball of the project's paths
+    # still avoids a full clone and its .git directory
+    if download and _handle_remote_get_tarball(
+        path_or_name, output_format, remote_url, output_dir,
+        repo_url, branch, token
+    ):
+        return
+
+    _handle_remote_get_full(
+        path_or_name, output_format, remote_url, download, output_dir,
+        repo_url, branch, token
+    )
+
+
+def _handle_remote_get_api(
+    path_or_name: str,
+    output_format: str,
+    remote_url: str,
+    repo_url: str,
+    branch: Optional[str],
+    token: Optional[str],
+) -> bool:
+    """Handle remote get through the GitHub API, without cloning.
+
+    The repository tree and ``cldpm.json`` are fetched concurrently, then
+    ``project.json``; no file contents beyond those are downloaded.
+
+    Returns:
+        True if the result was printed, False if the caller should fall
+        back to cloning (not a GitHub repository, truncated tree listing,
+        symlinked components, malformed configs, API error or rate limit).
+    """
+    from ..utils.git import fetch_github_file, fetch_github_tree
+
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            tree_future = executor.submit(fetch_github_tree, repo_url, branch, token)
+            config_future = executor.submit(
+                fetch_github_file, repo_url, "cldpm.json", branch, token
+            )
+            tree = tree_future.result()
+            cldpm_json = config_future.result()
+        if tree is None or cldpm_json is None:
+            return False
+
+        cldpm_config = json.loads(cldpm_json)
+        projects_dir = cldpm_config.get("projectsDir", "projects")
+        shared_dir = cldpm_config.get("sharedDir", "shared")
+        project_path = f"{projects_dir}/{path_or_name}"
+
+        project_json = fetch_github_file(
+            repo_url, f"{project_path}/project.json", branch, token
+        )
+        if project_json is None:
+            return False
+        project_config = json.loads(project_json)
+
+        # Index the tree as {directory: {name: kind}}
+        index: dict[str, dict[str, str]] = {}
+        for entry in tree:
+            parent, _, name = entry["path"].rpartition("/")
+            if entry["mode"] == "120000":
+                kind = "symlink"
+            elif entry["type"] == "tree":
+                kind = "dir"
+            elif entry["type"] == "blob":
+                kind = "file"
+            else:
+                kind = "other"
+            index.setdefault(parent, {})[name] = kind
+
+        result = _build_tree_result(
+            index, path_or_name, project_path, shared_dir, project_config,
+            project_config.get("dependencies", {}), remote_url, repo_url, branch
+        )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return False
+
+    if output_format == "json":
+        click.echo(_JSON_ENCODER.encode(result))
     else:
-        _handle_remote_get_full(
-            path_or_name, output_format, remote_url, download, output_dir,
-            repo_url, branch, token
+        print_tree(result)
+        console.print(f"\n[dim]Source: {remote_url}[/dim]")
+    return True
+
+
+def _handle_remote_get_tarball(
+    path_or_name: str,
+    output_format: str,
+    remote_url: str,
+    output_dir: Optional[str],
+    repo_url: str,
+    branch: Optional[str],
+    token: Optional[str],
+) -> bool:
+    """Handle remote get --download from a GitHub tarball, without cloning.
+
+    Used when Git lacks sparse checkout support, in place of a full clone.
+    The configs are read through the API, then the repository tarball is
+    streamed once and only the project and its dependencies are extracted.
+    Nothing is printed until the download has succeeded.
+
+    Returns:
+        True if the project was downloaded, False if the caller should fall
+        back to cloning (not a GitHub repository, API or network error,
+        rate limit or truncated archive).
+    """
+    import http.client
+    import tarfile
+
+    from ..utils.git import cleanup_temp_dir, download_github_tarball, fetch_github_file
+
+    temp_dir = None
+    try:
+        cldpm_json = fetch_github_file(repo_url, "cldpm.json", branch, token)
+        if cldpm_json is None:
+            return False
+        cldpm_config = json.loads(cldpm_json)
+        projects_dir = cldpm_config.get("projectsDir", "projects")
+        shared_dir = cldpm_config.get("sharedDir", "shared")
+        project_path = f"{projects_dir}/{path_or_name}"
+
+        project_json = fetch_github_file(
+            repo_url, f"{project_path}/project.json", branch, token
+        )
+        if project_json is None:
+            return False
+        project_config = json.loads(project_json)
+        dependencies = project_config.get("dependencies", {})
+
+        temp_dir = Path(tempfile.mkdtemp(prefix="cldpm-"))
+        if not download_github_tarball(
+            repo_url, _project_paths(project_path, shared_dir, dependencies),
+            temp_dir, branch, token
+        ):
+            cleanup_temp_dir(temp_dir)
+            return False
+    except (
+        OSError,
+        ValueError,
+        AttributeError,
+        TypeError,
+        EOFError,
+        http.client.HTTPException,
+        tarfile.TarError,
+    ):
+        if temp_dir:
+            cleanup_temp_dir(temp_dir)
+        return False
+
+    try:
+        result = _build_sparse_result(
+            temp_dir, path_or_name, project_path, shared_dir,
+            project_config, dependencies, remote_url, repo_url, branch
         )
 
+        if output_format == "json":
+            click.echo(_JSON_ENCODER.encode(result))
+        else:
+            print_tree(result)
+            console.print(f"\n[dim]Source: {remote_url}[/dim]")
+
+        _download_sparse_project(
+            temp_dir, output_dir, path_or_name, project_path,
+            shared_dir, dependencies, repo_url
+        )
+    finally:
+        cleanup_temp_dir(temp_dir)
+    return True
+
 
 def _handle_remote_get_sparse(
     path_or_name: str,
@@ -312,62 +694,68 @@ def _handle_remote_get_sparse(
     branch: Optional[str],
     token: Optional[str],
 ) -> None:
-    """Handle remote get using sparse checkout (optimized)."""
-    temp_config = None
+    """Handle remote get using sparse checkout (optimized).
+
+    A single blobless clone is made up front; each later phase only widens
+    its sparse checkout, which fetches the newly needed blobs without
+    cloning again.
+    """
+    import subprocess
+
+    from ..utils.git import (
+        cleanup_temp_dir,
+        export_checkout,
+        sparse_checkout_set,
+        sparse_clone,
+    )
+
+    temp_clone = None
     temp_dir = None
+    # Removes the clone in the background once its files are exported
+    cleaner = ThreadPoolExecutor(max_workers=1)
 
     try:
-        # Phase 1: Get config files only (tiny download)
+        # Phase 1: Clone with only the config checked out (tiny download)
         console.print(f"[dim]Fetching project config from {repo_url}...[/dim]")
-        config_paths = ["cldpm.json"]
-        temp_config = sparse_clone_to_temp(repo_url, config_paths, branch, token)
+        temp_clone = Path(tempfile.mkdtemp(prefix="cldpm-sparse-"))
+        sparse_clone(repo_url, ["cldpm.json"], temp_clone, branch, token)
 
         # Parse cldpm.json to get directories
-        cldpm_json_path = temp_config / "cldpm.json"
-        if not cldpm_json_path.exists():
+        try:
+            cldpm_config = json.loads((temp_clone / "cldpm.json").read_bytes())
+        except FileNotFoundError:
             print_error("Remote repository is not a CLDPM mono repo (no cldpm.json found)")
             raise SystemExit(1)
 
-        with open(cldpm_json_path) as f:
-            cldpm_config = json.load(f)
-
         projects_dir = cldpm_config.get("projectsDir", "projects")
         shared_dir = cldpm_config.get("sharedDir", "shared")
         project_path = f"{projects_dir}/{path_or_name}"
 
-        cleanup_temp_dir(temp_config)
-        temp_config = None
-
         # Phase 2: Get project.json to find dependencies
         console.print(f"[dim]Fetching project metadata...[/dim]")
-        project_config_paths = [f"{project_path}/project.json"]
-        temp_project = sparse_clone_to_temp(repo_url, project_config_paths, branch, token)
+        sparse_checkout_set(temp_clone, [f"{project_path}/project.json"])
 
-        project_json_path = temp_project / project_path / "project.json"
-        if not project_json_path.exists():
-            cleanup_temp_dir(temp_project)
+        try:
+            project_config = json.loads(
+                (temp_clone / project_path / "project.json").read_bytes()
+            )
+        except FileNotFoundError:
             print_error(f"Project not found: {path_or_name}")
             raise SystemExit(1)
 
-        with open(project_json_path) as f:
-            project_config = json.load(f)
-
-        cleanup_temp_dir(temp_project)
-
-        # Build path list for final sparse clone
-        # Include both directory and file patterns for each dependency
-        # since components can be directories (e.g., shared/skills/logging/)
-        # or files (e.g., shared/skills/new-skill.md)
-        all_paths = [project_path]
         dependencies = project_config.get("dependencies", {})
-        for dep_type in ["skills", "agents", "hooks", "rules"]:
-            for dep_name in dependencies.get(dep_type, []):
-                all_paths.append(f"{shared_dir}/{dep_type}/{dep_name}")
-                all_paths.append(f"{shared_dir}/{dep_type}/{dep_name}.*")
+        all_paths = _project_paths(project_path, shared_dir, dependencies)
 
         # Phase 3: Download everything needed
         console.print(f"[dim]Downloading project and dependencies...[/dim]")
-        temp_dir = sparse_clone_to_temp(repo_url, all_paths, branch, token)
+        sparse_checkout_set(temp_clone, all_paths)
+        temp_dir = Path(tempfile.mkdtemp(prefix="cldpm-"))
+        export_checkout(temp_clone, temp_dir)
+
+        # The clone and its .git objects are no longer needed; delete them
+        # while the result is printed and downloaded
+        cleaner.submit(shutil.rmtree, temp_clone, ignore_errors=True)
+        temp_clone = None
 
         # Build result for display
         result = _build_sparse_result(
@@ -377,7 +765,7 @@ def _handle_remote_get_sparse(
 
         # Output the result
         if output_format == "json":
-            click.echo(json.dumps(result, indent=2))
+            click.echo(_JSON_ENCODER.encode(result))
         else:
             print_tree(result)
             console.print(f"\n[dim]Source: {remote_url}[/dim]")
@@ -401,10 +789,11 @@ def _handle_remote_get_sparse(
             print_error(f"Git error: {error_msg}")
         raise SystemExit(1)
     finally:
-        if temp_config:
-            cleanup_temp_dir(temp_config)
+        if temp_clone:
+            shutil.rmtree(temp_clone, ignore_errors=True)
         if temp_dir and not download:
             cleanup_temp_dir(temp_dir)
+        cleaner.shutdown()
 
 
 def _handle_remote_get_full(
@@ -418,6 +807,10 @@ def _handle_remote_get_full(
     token: Optional[str],
 ) -> None:
     """Handle remote get using full clone (fallback for old Git versions)."""
+    import subprocess
+
+    from ..utils.git import cleanup_temp_dir, clone_to_temp
+
     temp_dir = None
     try:
         # Clone to temporary directory
@@ -431,7 +824,8 @@ def _handle_remote_get_full(
 
         # Resolve the project
         try:
-            result = resolve_project(path_or_name, temp_dir)
+            cldpm_config = load_cldpm_config(temp_dir)
+            result = resolve_project(path_or_name, temp_dir, cldpm_config)
         except FileNotFoundError as e:
             print_error(str(e))
             raise SystemExit(1)
@@ -445,14 +839,14 @@ def _handle_remote_get_full(
 
         # Output the result
         if output_format == "json":
-            click.echo(json.dumps(result, indent=2))
+            click.echo(_JSON_ENCODER.encode(result))
         else:
             print_tree(result)
             console.print(f"\n[dim]Source: {remote_url}[/dim]")
 
         # Download if requested
         if download:
-            _download_remote_project(result, temp_dir, output_dir, repo_url)
+            _download_remote_project(result, temp_dir, cldpm_config, output_dir, repo_url)
 
     except subprocess.CalledProcessError as e:
         error_msg = e.stderr if e.stderr else str(e)
@@ -500,16 +894,18 @@ def _build_sparse_result(
     }
 
     # Build shared components info
-    for dep_type in ["skills", "agents", "hooks", "rules"]:
+    for dep_type in _COMPONENT_TYPES:
         result["shared"][dep_type] = []
-        for dep_name in dependencies.get(dep_type, []):
-            source_comp = _find_component_path(
-                temp_dir / shared_dir, dep_type, dep_name
-            )
+        dep_names = dependencies.get(dep_type, [])
+        if not dep_names:
+            continue
+        components = _index_components(temp_dir / shared_dir / dep_type)
+        for dep_name in dep_names:
+            source_comp = components.get(dep_name)
             if source_comp:
                 # Get list of files in the component
                 if source_comp.is_dir():
-                    files = [f.name for f in source_comp.iterdir() if f.is_file()]
+                    files = _list_files(source_comp.path)
                 else:
                     files = [source_comp.name]
                 result["shared"][dep_type].append({
@@ -521,204 +917,170 @@ def _build_sparse_result(
 
     # Build local components info
     claude_dir = source_project / ".claude"
-    for dep_type in ["skills", "agents", "hooks", "rules"]:
+    for dep_type in _COMPONENT_TYPES:
         result["local"][dep_type] = []
-        type_dir = claude_dir / dep_type
-        if type_dir.exists():
-            for item in type_dir.iterdir():
-                if item.name != ".gitignore" and not item.is_symlink():
-                    # Get list of files in the component
-                    if item.is_dir():
-                        files = [f.name for f in item.iterdir() if f.is_file()]
-                    else:
-                        files = [item.name]
-                    result["local"][dep_type].append({
-                        "name": item.name,
-                        "type": "local",
-                        "sourcePath": f".claude/{dep_type}/{item.name}",
-                        "files": files,
-                    })
+        try:
+            with os.scandir(claude_dir / dep_type) as entries:
+                items = [
+                    entry for entry in entries
+                    if entry.name != ".gitignore" and not entry.is_symlink()
+                ]
+        except FileNotFoundError:
+            continue
+        for item in items:
+            # Get list of files in the component
+            if item.is_dir(follow_symlinks=False):
+                files = _list_files(item.path)
+            else:
+                files = [item.name]
+            result["local"][dep_type].append({
+                "name": item.name,
+                "type": "local",
+                "sourcePath": f".claude/{dep_type}/{item.name}",
+                "files": files,
+            })
 
     return result
 
 
-def _download_sparse_project(
-    temp_dir: Path,
-    output_dir: Optional[str],
+def _build_tree_result(
+    index: dict[str, dict[str, str]],
     project_name: str,
     project_path: str,
     shared_dir: str,
+    project_config: dict,
     dependencies: dict,
+    remote_url: str,
     repo_url: str,
-) -> None:
-    """Download a project from sparse clone with proper file placement."""
-    # Determine target directory
-    if output_dir:
-        target = Path(output_dir).resolve()
-    else:
-        target = Path.cwd() / project_name
-
-    if target.exists():
-        print_error(f"Target directory already exists: {target}")
-        raise SystemExit(1)
+    branch: Optional[str],
+) -> dict:
+    """Build the result dictionary from a GitHub tree index.
 
-    source_project = temp_dir / project_path
+    Mirrors ``_build_sparse_result``, with ``index`` mapping each directory
+    path to ``{name: "file" | "dir" | "symlink" | "other"}`` for its
+    entries, and matches components with the same ``_index_entries`` rules.
+    With no checkout to point at, ``path`` is the path within the repository.
 
-    # Create target directory
-    ensure_dir(target)
+    Raises:
+        ValueError: If a symlink would need resolving. The tree listing
+            does not say what a symlink points at, so only a checkout can
+            tell whether it is a file or a directory.
+    """
 
-    # Copy project files
-    for item in source_project.iterdir():
-        dest = target / item.name
+    def entries_of(dir_path: str, skip_symlinks: bool = False) -> dict[str, str]:
+        entries = index.get(dir_path, {})
+        if not skip_symlinks and "symlink" in entries.values():
+            raise ValueError(f"Cannot resolve symlinks in {dir_path} without a checkout")
+        return entries
 
-        if item.name == ".claude":
-            # Handle .claude directory specially
-            ensure_dir(dest)
-            for claude_item in item.iterdir():
-                claude_dest = dest / claude_item.name
+    def list_files(dir_path: str) -> list[str]:
+        return [name for name, kind in entries_of(dir_path).items() if kind == "file"]
 
-                if claude_item.name in ["skills", "agents", "hooks", "rules"]:
-                    # Create directory
-                    ensure_dir(claude_dest)
+    project_id = (project_config.get("id") or project_name).strip() or project_name
 
-                    # Copy local (non-symlink) components directly
-                    for comp_item in claude_item.iterdir():
-                        if comp_item.name == ".gitignore":
-                            continue
-                        if not comp_item.is_symlink():
-                            comp_dest = claude_dest / comp_item.name
-                            if comp_item.is_dir():
-                                shutil.copytree(comp_item, comp_dest)
-                            else:
-                                shutil.copy2(comp_item, comp_dest)
-                elif claude_item.is_file():
-                    shutil.copy2(claude_item, claude_dest)
-                elif claude_item.is_dir():
-                    shutil.copytree(claude_item, claude_dest)
-        elif item.is_dir():
-            shutil.copytree(item, dest, symlinks=False)
-        else:
-            shutil.copy2(item, dest)
+    result = {
+        "id": project_id,
+        "path": project_path,
+        "config": {**project_config, "id": project_id},
+        "shared": {},
+        "local": {},
+        "remote": {
+            "url": remote_url,
+            "repo_url": repo_url,
+            "branch": branch,
+        },
+    }
 
-    # Place shared components directly in .claude/<type>/<name>/
-    for dep_type in ["skills", "agents", "hooks", "rules"]:
-        for dep_name in dependencies.get(dep_type, []):
-            source_comp = _find_component_path(
-                temp_dir / Path(shared_dir), dep_type, dep_name
-            )
-            if source_comp is None:
+    # Build shared components info
+    for dep_type in _COMPONENT_TYPES:
+        result["shared"][dep_type] = []
+        dep_names = dependencies.get(dep_type, [])
+        if not dep_names:
+            continue
+        type_path = f"{shared_dir}/{dep_type}"
+        components = _index_entries(
+            (name, kind == "dir", kind == "file", (name, kind))
+            for name, kind in entries_of(type_path).items()
+        )
+        for dep_name in dep_names:
+            match = components.get(dep_name)
+            if match is None:
                 continue
-            target_comp = target / ".claude" / dep_type / source_comp.name
+            comp_name, kind = match
+            if kind == "dir":
+                files = list_files(f"{type_path}/{comp_name}")
+            else:
+                files = [comp_name]
+            result["shared"][dep_type].append({
+                "name": dep_name,
+                "type": "shared",
+                "sourcePath": f"{type_path}/{comp_name}",
+                "files": files,
+            })
 
-            if not target_comp.exists():
-                ensure_dir(target_comp.parent)
-                if source_comp.is_dir():
-                    shutil.copytree(source_comp, target_comp)
-                else:
-                    shutil.copy2(source_comp, target_comp)
+    # Build local components info
+    for dep_type in _COMPONENT_TYPES:
+        result["local"][dep_type] = []
+        type_path = f"{project_path}/.claude/{dep_type}"
+        for name, kind in entries_of(type_path, skip_symlinks=True).items():
+            if name == ".gitignore" or kind == "symlink":
+                continue
+            result["local"][dep_type].append({
+                "name": name,
+                "type": "local",
+                "sourcePath": f".claude/{dep_type}/{name}",
+                "files": list_files(f"{type_path}/{name}") if kind == "dir" else [name],
+            })
 
-    # Count what was copied
-    shared_counts = {
-        dep_type: len(dependencies.get(dep_type, []))
-        for dep_type in ["skills", "agents", "hooks", "rules"]
-    }
-    local_counts = {dep_type: 0 for dep_type in ["skills", "agents", "hooks", "rules"]}
+    return result
 
-    # Count local components
-    claude_dir = source_project / ".claude"
-    for dep_type in ["skills", "agents", "hooks", "rules"]:
-        type_dir = claude_dir / dep_type
-        if type_dir.exists():
-            for item in type_dir.iterdir():
-                if item.name != ".gitignore" and not item.is_symlink():
-                    local_counts[dep_type] += 1
 
-    print_success(f"Downloaded to {target}")
-    console.print(f"  [dim]Source: {repo_url}[/dim]")
+def _download_sparse_project(
+    temp_dir: Path,
+    output_dir: Optional[str],
+    project_name: str,
+    project_path: str,
+    shared_dir: str,
+    dependencies: dict,
+    repo_url: str,
+) -> None:
+    """Download a project from sparse clone with proper file placement."""
+    target = _prepare_target(output_dir, project_name)
+    source_project = temp_dir / project_path
 
-    non_zero_shared = {k: v for k, v in shared_counts.items() if v > 0}
-    non_zero_local = {k: v for k, v in local_counts.items() if v > 0}
+    # Copy project files, counting local components on the way
+    local_counts = _copy_project_files(source_project, target)
 
-    if non_zero_shared:
-        deps_str = ", ".join(f"{v} {k}" for k, v in non_zero_shared.items())
-        console.print(f"  Shared: {deps_str}")
+    # Place shared components directly in .claude/<type>/<name>/
+    _copy_shared_components(temp_dir / shared_dir, target, dependencies)
 
-    if non_zero_local:
-        deps_str = ", ".join(f"{v} {k}" for k, v in non_zero_local.items())
-        console.print(f"  Local: {deps_str}")
+    print_success(f"Downloaded to {target}")
+    console.print(f"  [dim]Source: {repo_url}[/dim]")
+    _print_download_counts(_component_counts(dependencies), local_counts)
 
 
 def _download_remote_project(
     resolved: dict,
     temp_dir: Path,
+    cldpm_config: CldpmConfig,
     output_dir: Optional[str],
     repo_url: str,
 ) -> None:
     """Download a remote project with all dependencies resolved."""
-    project_id = resolved["id"]
-
-    # Determine target directory
-    if output_dir:
-        target = Path(output_dir).resolve()
-    else:
-        target = Path.cwd() / project_id
-
-    if target.exists():
-        print_error(f"Target directory already exists: {target}")
-        raise SystemExit(1)
+    from ..utils.git import cleanup_temp_dir
 
     # For remote, we copy the resolved project (similar to local download)
     # but from the temp directory
-    cldpm_config = load_cldpm_config(temp_dir)
     shared_dir = temp_dir / cldpm_config.shared_dir
     source_path = Path(resolved["path"])
 
-    # Create target directory
-    ensure_dir(target)
+    target = _prepare_target(output_dir, resolved["id"])
 
     # Copy project files
-    for item in source_path.iterdir():
-        dest = target / item.name
-
-        if item.name == ".claude":
-            ensure_dir(dest)
-            for claude_item in item.iterdir():
-                claude_dest = dest / claude_item.name
-
-                if claude_item.name in ["skills", "agents", "hooks", "rules"]:
-                    ensure_dir(claude_dest)
-                    for comp_item in claude_item.iterdir():
-                        if comp_item.name == ".gitignore":
-                            continue
-                        if not comp_item.is_symlink():
-                            comp_dest = claude_dest / comp_item.name
-                            if comp_item.is_dir():
-                                shutil.copytree(comp_item, comp_dest)
-                            else:
-                                shutil.copy2(comp_item, comp_dest)
-                elif claude_item.is_file():
-                    shutil.copy2(claude_item, claude_dest)
-                elif claude_item.is_dir():
-                    shutil.copytree(claude_item, claude_dest)
-        elif item.is_dir():
-            shutil.copytree(item, dest, symlinks=False)
-        else:
-            shutil.copy2(item, dest)
+    _copy_project_files(source_path, target)
 
     # Copy shared dependencies
-    for dep_type in ["skills", "agents", "hooks", "rules"]:
-        for component in resolved["shared"].get(dep_type, []):
-            comp_name = component["name"]
-            source_comp = _find_component_path(shared_dir, dep_type, comp_name)
-            if source_comp is None:
-                continue
-            target_comp = target / ".claude" / dep_type / source_comp.name
-
-            if not target_comp.exists():
-                if source_comp.is_dir():
-                    shutil.copytree(source_comp, target_comp)
-                else:
-                    shutil.copy2(source_comp, target_comp)
+    _copy_shared_components(shared_dir, target, _shared_names(resolved))
 
     # Clean up temp directory
     cleanup_temp_dir(temp_dir)
@@ -1,15 +1,16 @@
 """Implementation of cldpm init command."""
 
+import os
 from pathlib import Path
 from typing import Optional
 
 import click
-from jinja2 import Environment, PackageLoader
 
 from ..schemas import CldpmConfig, ProjectConfig, ProjectDependencies
 from ..core.config import save_cldpm_config, save_project_config
 from ..utils.fs import ensure_dir
 from ..utils.output import print_success, print_error, print_warning, print_dir_tree, console
+from ..utils.templates import get_template
 from ..ai_rules import create_ai_rules, append_to_claude_md
 
 
@@ -118,13 +119,10 @@ def init(
     for dir_path in dirs_to_create:
         ensure_dir(repo_root / dir_path)
 
-    # Create templates using Jinja2
-    env = Environment(loader=PackageLoader("cldpm", "templates"))
-
     # Create root CLAUDE.md (only if it doesn't exist or not in existing mode)
     claude_md_path = repo_root / "CLAUDE.md"
     if not existing or not claude_md_path.exists():
-        template = env.get_template("ROOT_CLAUDE.md.j2")
+        template = get_template("ROOT_CLAUDE.md.j2")
         claude_md = template.render(repo_name=name)
         claude_md_path.write_text(claude_md)
 
@@ -135,7 +133,7 @@ def init(
         _update_gitignore(gitignore_path)
     else:
         # Create new .gitignore from template
-        template = env.get_template("gitignore.j2")
+        template = get_template("gitignore.j2")
         gitignore = template.render()
         gitignore_path.write_text(gitignore)
 
@@ -150,7 +148,7 @@ def init(
 
     # Adopt existing projects if requested
     if adopt_projects:
-        adopted = _adopt_projects(repo_root, adopt_projects, projects_dir, env)
+        adopted = _adopt_projects(repo_root, adopt_projects, projects_dir)
         if adopted:
             console.print(f"  Adopted {len(adopted)} project(s): {', '.join(adopted)}")
 
@@ -162,12 +160,6 @@ def _update_gitignore(gitignore_path: Path) -> None:
     """Update existing .gitignore with CLDPM-specific section."""
     from ..ai_rules import CLDPM_SECTION_START, CLDPM_SECTION_END
 
-    existing_content = gitignore_path.read_text()
-
-    # Check if CLDPM section already exists
-    if CLDPM_SECTION_START in existing_content or "CLDPM" in existing_content:
-        return
-
     cldpm_section = f"""
 # {CLDPM_SECTION_START}
 # CLDPM - Claude Project Manager
@@ -180,16 +172,49 @@ def _update_gitignore(gitignore_path: Path) -> None:
 # {CLDPM_SECTION_END}
 """
 
-    # Append CLDPM section
-    with open(gitignore_path, "a") as f:
+    # Read and append through one handle; after read() it is positioned at EOF
+    with open(gitignore_path, "r+") as f:
+        existing_content = f.read()
+
+        # Check if CLDPM section already exists
+        if CLDPM_SECTION_START in existing_content or "CLDPM" in existing_content:
+            return
+
+        # Append CLDPM section
         f.write(cldpm_section)
 
 
+# Names whose presence marks a directory as a project when auto-adopting
+_PROJECT_INDICATORS = frozenset({
+    "package.json",
+    "pyproject.toml",
+    "setup.py",
+    "Cargo.toml",
+    "go.mod",
+    "pom.xml",
+    "build.gradle",
+    "Makefile",
+    "CMakeLists.txt",
+    "src",
+    "lib",
+    "app",
+    "main.py",
+    "index.js",
+    "index.ts",
+    "CLAUDE.md",
+    ".claude",
+})
+
+# Repo root directories never considered for auto-adoption
+_ADOPT_SKIP_DIRS = frozenset({
+    "shared", "projects", ".cldpm", "node_modules", "__pycache__", "venv", ".venv",
+})
+
+
 def _adopt_projects(
     repo_root: Path,
     adopt_projects: str,
     projects_dir: str,
-    env: Environment,
 ) -> list[str]:
     """Adopt existing directories as CLDPM projects.
 
@@ -197,7 +222,6 @@ def _adopt_projects(
         repo_root: Path to the repo root.
         adopt_projects: Comma-separated project paths or 'auto'.
         projects_dir: Directory containing projects.
-        env: Jinja2 environment for templates.
 
     Returns:
         List of adopted project names.
@@ -209,23 +233,28 @@ def _adopt_projects(
         # Auto-detect: look for directories in projects_dir or repo root
         candidates = []
 
-        # Check projects directory
+        # Check projects directory; scandir entries carry their type, so
+        # the is_dir checks below need no extra stat per entry
         if projects_path.exists():
-            candidates.extend(
-                [d for d in projects_path.iterdir() if d.is_dir() and not d.name.startswith(".")]
-            )
+            with os.scandir(projects_path) as entries:
+                candidates.extend(
+                    Path(entry.path) for entry in entries
+                    if entry.is_dir() and not entry.name.startswith(".")
+                )
 
         # If no projects_dir or it's empty, check repo root for potential projects
         if not candidates:
-            for item in repo_root.iterdir():
-                if (
-                    item.is_dir()
-                    and not item.name.startswith(".")
-                    and item.name not in ["shared", "projects", ".cldpm", "node_modules", "__pycache__", "venv", ".venv"]
-                ):
-                    # Check if it looks like a project (has code or package files)
-                    if _looks_like_project(item):
-                        candidates.append(item)
+            with os.scandir(repo_root) as entries:
+                for entry in entries:
+                    if (
+                        entry.is_dir()
+                        and not entry.name.startswith(".")
+                        and entry.name not in _ADOPT_SKIP_DIRS
+                    ):
+                        # Check if it looks like a project (has code or package files)
+                        item = Path(entry.path)
+                        if _looks_like_project(item):
+                            candidates.append(item)
     else:
         # Explicit project paths
         candidates = []
@@ -264,7 +293,7 @@ def _adopt_projects(
                 # Create the project in projects_dir with a reference
                 ensure_dir(target_path)
                 save_project_config(project_config, target_path)
-                _setup_project_structure(target_path, env, project_name)
+                _setup_project_structure(target_path, project_name)
 
                 # Note: The original directory stays in place
                 # User may want to move files manually or set up differently
@@ -276,7 +305,7 @@ def _adopt_projects(
         else:
             # Project is already in projects_dir
             save_project_config(project_config, candidate)
-            _setup_project_structure(candidate, env, project_name)
+            _setup_project_structure(candidate, project_name)
             adopted.append(project_name)
 
     return adopted
@@ -287,36 +316,11 @@ def _looks_like_project(path: Path) -> bool:
 
     Looks for common project indicators like package files, source directories, etc.
     """
-    indicators = [
-        "package.json",
-        "pyproject.toml",
-        "setup.py",
-        "Cargo.toml",
-        "go.mod",
-        "pom.xml",
-        "build.gradle",
-        "Makefile",
-        "CMakeLists.txt",
-        "src",
-        "lib",
-        "app",
-        "main.py",
-        "index.js",
-        "index.ts",
-        "CLAUDE.md",
-        ".claude",
-    ]
-
-    for indicator in indicators:
-        if (path / indicator).exists():
-            return True
-
-    return False
+    return any((path / indicator).exists() for indicator in _PROJECT_INDICATORS)
 
 
 def _setup_project_structure(
     project_path: Path,
-    env: Environment,
     project_name: str,
 ) -> None:
     """Set up the standard CLDPM project structure."""
@@ -339,7 +343,7 @@ def _setup_project_structure(
     # Create CLAUDE.md from template if it doesn't exist
     claude_md_path = project_path / "CLAUDE.md"
     if not claude_md_path.exists():
-        template = env.get_template("CLAUDE.md.j2")
+        template = get_template("CLAUDE.md.j2")
         claude_md = template.render(
             project_name=project_name,
             description="",
@@ -88,13 +88,17 @@ def save_project_config(config: ProjectConfig, project_path: Path) -> None:
 
 
 def get_project_path(
-    project_name: str, repo_root: Optional[Path] = None
+    project_name: str,
+    repo_root: Optional[Path] = None,
+    cldpm_config: Optional[CldpmConfig] = None,
 ) -> Optional[Path]:
     """Get the path to a project by id or name.
 
     Args:
         project_name: Project id (preferred) or name.
         repo_root: Path to the repo root. If None, will search for it.
+        cldpm_config: Already-loaded cldpm.json config. If None, it is
+            loaded from the repo root.
 
     Returns:
         Path to the project directory, or None if not found.
@@ -104,7 +108,9 @@ def get_project_path(
         if repo_root is None:
             return None
 
-    config = load_cldpm_config(repo_root)
+    config = cldpm_config
+    if config is None:
+        config = load_cldpm_config(repo_root)
     # Fast path: direct directory match by id
     project_path = repo_root / config.projects_dir / project_name
     if project_path.exists() and (project_path / "project.json").exists():
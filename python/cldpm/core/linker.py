@@ -92,6 +92,22 @@ def update_component_gitignore(component_dir: Path, symlinked_names: list[str])
     gitignore_path.write_text("\n".join(lines))
 
 
+def _list_dir_names(path: Path) -> set[str]:
+    """Return the names of the existing entries in a directory, or an empty set.
+
+    Dangling symlinks are left out, matching ``Path.exists()``.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {
+                entry.name
+                for entry in entries
+                if not entry.is_symlink() or os.path.exists(entry.path)
+            }
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
 def sync_project_links(
     project_path: Path, repo_root: Optional[Path] = None
 ) -> dict[str, list[str]]:
@@ -132,11 +148,15 @@ def sync_project_links(
         # Track successfully created symlinks for .gitignore
         symlinked_names = []
 
+        # One directory read instead of an exists() check per dependency;
+        # misses still go through exists() for case-insensitive filesystems
+        available = _list_dir_names(shared_dir / dep_type) if deps else set()
+
         for dep_name in deps:
             source = shared_dir / dep_type / dep_name
             target = target_dir / dep_name
 
-            if not source.exists():
+            if dep_name not in available and not source.exists():
                 result["missing"].append(f"{dep_type}/{dep_name}")
                 continue
 
@@ -3,6 +3,7 @@
 from pathlib import Path
 from typing import Any, Optional
 
+from ..schemas import CldpmConfig
 from ..utils.fs import find_repo_root
 from .config import (
     get_project_path,
@@ -128,13 +129,17 @@ def get_local_components_in_project(
 
 
 def resolve_project(
-    project_path_or_name: str, repo_root: Optional[Path] = None
+    project_path_or_name: str,
+    repo_root: Optional[Path] = None,
+    cldpm_config: Optional[CldpmConfig] = None,
 ) -> dict[str, Any]:
     """Resolve a project and all its dependencies.
 
     Args:
         project_path_or_name: Path to the project directory or project name.
         repo_root: Path to the repo root. If None, will search for it.
+        cldpm_config: Already-loaded cldpm.json config. If None, it is
+            loaded from the repo root.
 
     Returns:
         Dictionary with resolved project info.
@@ -156,12 +161,13 @@ def resolve_project(
             project_path = full_path
         else:
             # Try as project name
-            project_path = get_project_path(project_path_or_name, repo_root)
+            project_path = get_project_path(project_path_or_name, repo_root, cldpm_config)
 
     if project_path is None or not project_path.exists():
         raise FileNotFoundError(f"Project not found: {project_path_or_name}")
 
-    cldpm_config = load_cldpm_config(repo_root)
+    if cldpm_config is None:
+        cldpm_config = load_cldpm_config(repo_root)
     project_config = load_project_config(project_path)
 
     shared_dir = repo_root / cldpm_config.shared_dir
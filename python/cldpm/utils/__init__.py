@@ -1,15 +1,20 @@
 """Utility modules for CLDPM."""
 
+import importlib
+
 from .fs import find_repo_root, ensure_dir, is_symlink
-from .git import (
-    get_github_token,
-    parse_repo_url,
-    clone_repo,
-    clone_to_temp,
-    cleanup_temp_dir,
-)
 from .output import console, print_error, print_success, print_warning, print_tree
 
+# Git helpers pull in subprocess, urllib and tarfile, which only remote
+# operations need, so they are imported on first attribute access.
+_GIT_EXPORTS = (
+    "get_github_token",
+    "parse_repo_url",
+    "clone_repo",
+    "clone_to_temp",
+    "cleanup_temp_dir",
+)
+
 __all__ = [
     "find_repo_root",
     "ensure_dir",
@@ -25,3 +30,12 @@ __all__ = [
     "print_warning",
     "print_tree",
 ]
+
+
+def __getattr__(name: str):
+    """Import a git helper on first access (PEP 562)."""
+    if name not in _GIT_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(".git", __name__), name)
+    globals()[name] = value
+    return value
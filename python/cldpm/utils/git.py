@@ -1,13 +1,31 @@
 """Git utility functions for remote repository operations."""
 
+import base64
+import fnmatch
+import json
 import os
 import re
 import shutil
 import subprocess
+import tarfile
 import tempfile
+import urllib.error
+import urllib.request
 from pathlib import Path
-from typing import Optional
-from urllib.parse import urlparse
+from typing import Any, Optional
+from urllib.parse import quote, urlparse
+
+GITHUB_API_URL = "https://api.github.com"
+
+# Seconds to wait on a GitHub API metadata request before giving up;
+# kept short since callers fall back to cloning
+GITHUB_API_TIMEOUT = 3
+
+# Seconds to wait on a stalled GitHub tarball download before giving up
+GITHUB_DOWNLOAD_TIMEOUT = 30
+
+# Reject unsafe tar members where the interpreter supports extraction filters
+_TAR_EXTRACT_KWARGS = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
 
 
 def get_github_token() -> Optional[str]:
@@ -199,6 +217,106 @@ def has_sparse_clone_support() -> bool:
         return False
 
 
+def sparse_clone(
+    repo_url: str,
+    paths: list[str],
+    clone_dir: Path,
+    branch: Optional[str] = None,
+    token: Optional[str] = None,
+) -> None:
+    """Partially clone a repository with only specific paths checked out.
+
+    The clone is blobless (--filter=blob:none), so only trees are fetched
+    up front and file contents are downloaded as paths are checked out.
+    The clone keeps its .git directory, so the checked-out paths can later
+    be changed with sparse_checkout_set() without cloning again.
+
+    Args:
+        repo_url: The repository URL.
+        paths: List of paths to check out.
+        clone_dir: Empty directory to clone into.
+        branch: Optional branch to checkout.
+        token: Optional GitHub token for authentication.
+
+    Raises:
+        subprocess.CalledProcessError: If git commands fail.
+    """
+    # Inject token for auth
+    auth_url = repo_url
+    if token and "github.com" in repo_url:
+        auth_url = repo_url.replace(
+            "https://github.com", f"https://{token}@github.com"
+        )
+
+    env = os.environ.copy()
+    env["GIT_TERMINAL_PROMPT"] = "0"
+
+    # Partial clone (tree-only, no blobs initially)
+    clone_cmd = [
+        "git",
+        "clone",
+        "--filter=blob:none",
+        "--sparse",
+        "--depth",
+        "1",
+    ]
+    if branch:
+        clone_cmd.extend(["--branch", branch])
+    clone_cmd.extend([auth_url, str(clone_dir)])
+
+    subprocess.run(clone_cmd, check=True, capture_output=True, env=env)
+
+    # Configure sparse checkout for exact paths
+    sparse_checkout_set(clone_dir, paths)
+
+
+def sparse_checkout_set(clone_dir: Path, paths: list[str]) -> None:
+    """Replace the checked-out paths of a sparse clone.
+
+    Only blobs for newly included paths are fetched; the clone, its refs
+    and trees are reused.
+
+    Args:
+        clone_dir: Directory of a clone made by sparse_clone().
+        paths: List of paths to check out.
+
+    Raises:
+        subprocess.CalledProcessError: If git commands fail.
+    """
+    env = os.environ.copy()
+    env["GIT_TERMINAL_PROMPT"] = "0"
+
+    sparse_cmd = ["git", "sparse-checkout", "set", "--no-cone"] + paths
+    subprocess.run(sparse_cmd, cwd=clone_dir, check=True, capture_output=True, env=env)
+
+
+def export_checkout(clone_dir: Path, target_dir: Path) -> None:
+    """Copy the checked-out files of a clone to a directory, excluding .git.
+
+    Broken symlinks are skipped since they can't be resolved.
+
+    Args:
+        clone_dir: Directory of the clone.
+        target_dir: Directory to place the files in.
+    """
+    def _ignore_broken_symlinks_and_git(directory, contents):
+        ignored = []
+        for item in contents:
+            if item == ".git":
+                ignored.append(item)
+                continue
+            item_path = Path(directory) / item
+            if item_path.is_symlink() and not item_path.resolve().exists():
+                ignored.append(item)
+        return ignored
+
+    target_dir.mkdir(parents=True, exist_ok=True)
+    shutil.copytree(
+        clone_dir, target_dir, dirs_exist_ok=True,
+        ignore=_ignore_broken_symlinks_and_git,
+    )
+
+
 def sparse_clone_paths(
     repo_url: str,
     paths: list[str],
@@ -225,55 +343,8 @@ def sparse_clone_paths(
     temp_clone = Path(tempfile.mkdtemp(prefix="cldpm-sparse-"))
 
     try:
-        # Inject token for auth
-        auth_url = repo_url
-        if token and "github.com" in repo_url:
-            auth_url = repo_url.replace(
-                "https://github.com", f"https://{token}@github.com"
-            )
-
-        env = os.environ.copy()
-        env["GIT_TERMINAL_PROMPT"] = "0"
-
-        # Step 1: Partial clone (tree-only, no blobs initially)
-        clone_cmd = [
-            "git",
-            "clone",
-            "--filter=blob:none",
-            "--sparse",
-            "--depth",
-            "1",
-        ]
-        if branch:
-            clone_cmd.extend(["--branch", branch])
-        clone_cmd.extend([auth_url, str(temp_clone)])
-
-        subprocess.run(clone_cmd, check=True, capture_output=True, env=env)
-
-        # Step 2: Configure sparse checkout for exact paths
-        sparse_cmd = ["git", "sparse-checkout", "set", "--no-cone"] + paths
-        subprocess.run(
-            sparse_cmd, cwd=temp_clone, check=True, capture_output=True, env=env
-        )
-
-        # Step 3: Copy sparse checkout to target (excluding .git)
-        # Skip broken symlinks during copy (they can't be resolved)
-        def _ignore_broken_symlinks_and_git(directory, contents):
-            ignored = []
-            for item in contents:
-                if item == ".git":
-                    ignored.append(item)
-                    continue
-                item_path = Path(directory) / item
-                if item_path.is_symlink() and not item_path.resolve().exists():
-                    ignored.append(item)
-            return ignored
-
-        target_dir.mkdir(parents=True, exist_ok=True)
-        shutil.copytree(
-            temp_clone, target_dir, dirs_exist_ok=True,
-            ignore=_ignore_broken_symlinks_and_git,
-        )
+        sparse_clone(repo_url, paths, temp_clone, branch, token)
+        export_checkout(temp_clone, target_dir)
     finally:
         shutil.rmtree(temp_clone, ignore_errors=True)
 
@@ -298,3 +369,166 @@ def sparse_clone_to_temp(
     temp_dir = Path(tempfile.mkdtemp(prefix="cldpm-"))
     sparse_clone_paths(repo_url, paths, temp_dir, branch, token)
     return temp_dir
+
+
+def _github_repo_path(repo_url: str) -> Optional[str]:
+    """Get the ``owner/repo`` path of a GitHub repository URL, or None."""
+    parsed = urlparse(repo_url)
+    if parsed.netloc != "github.com":
+        return None
+    path = parsed.path.strip("/")
+    if path.endswith(".git"):
+        path = path[:-4]
+    return path if path.count("/") == 1 else None
+
+
+def _github_api_request(url: str, token: Optional[str] = None) -> urllib.request.Request:
+    """Build a GitHub API request, authenticated if a token is given."""
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "cldpm",
+    }
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return urllib.request.Request(url, headers=headers)
+
+
+def _github_api_get(url: str, token: Optional[str] = None) -> Any:
+    """GET a GitHub API URL and decode the JSON response."""
+    request = _github_api_request(url, token)
+    with urllib.request.urlopen(request, timeout=GITHUB_API_TIMEOUT) as response:
+        return json.load(response)
+
+
+def fetch_github_tree(
+    repo_url: str,
+    branch: Optional[str] = None,
+    token: Optional[str] = None,
+) -> Optional[list[dict]]:
+    """List every path in a GitHub repository with one API request.
+
+    Args:
+        repo_url: The repository URL.
+        branch: Optional branch to list. Defaults to the default branch.
+        token: Optional GitHub token for authentication.
+
+    Returns:
+        Git tree entries (``path``, ``mode``, ``type``), or None if the
+        repository is not on GitHub or the listing was truncated.
+
+    Raises:
+        urllib.error.URLError: If the request fails.
+    """
+    repo_path = _github_repo_path(repo_url)
+    if repo_path is None:
+        return None
+    ref = quote(branch, safe="") if branch else "HEAD"
+    tree = _github_api_get(
+        f"{GITHUB_API_URL}/repos/{repo_path}/git/trees/{ref}?recursive=1", token
+    )
+    if tree.get("truncated"):
+        return None
+    return tree["tree"]
+
+
+def fetch_github_file(
+    repo_url: str,
+    path: str,
+    branch: Optional[str] = None,
+    token: Optional[str] = None,
+) -> Optional[bytes]:
+    """Fetch a single file from a GitHub repository without cloning.
+
+    Args:
+        repo_url: The repository URL.
+        path: Path of the file within the repository.
+        branch: Optional branch to read from. Defaults to the default branch.
+        token: Optional GitHub token for authentication.
+
+    Returns:
+        The file contents, or None if the repository is not on GitHub or
+        the file does not exist.
+
+    Raises:
+        urllib.error.URLError: If the request fails for another reason.
+    """
+    repo_path = _github_repo_path(repo_url)
+    if repo_path is None:
+        return None
+    url = f"{GITHUB_API_URL}/repos/{repo_path}/contents/{quote(path)}"
+    if branch:
+        url += f"?ref={quote(branch, safe='')}"
+    try:
+        content = _github_api_get(url, token)
+    except urllib.error.HTTPError as e:
+        if e.code == 404:
+            return None
+        raise
+    if not isinstance(content, dict) or content.get("encoding") != "base64":
+        return None
+    return base64.b64decode(content["content"])
+
+
+def _matches_sparse_path(path: str, patterns: list[str]) -> bool:
+    """Check a path against sparse checkout patterns and their subtrees."""
+    return any(
+        fnmatch.fnmatchcase(path, pattern) or path.startswith(pattern + "/")
+        for pattern in patterns
+    )
+
+
+def download_github_tarball(
+    repo_url: str,
+    paths: list[str],
+    target_dir: Path,
+    branch: Optional[str] = None,
+    token: Optional[str] = None,
+) -> bool:
+    """Extract selected paths from a GitHub repository tarball.
+
+    The archive is streamed and only members matching ``paths`` are
+    written, so no clone or ``.git`` directory is created. Symlinks left
+    dangling by the selection are removed, as in ``export_checkout``.
+
+    Args:
+        repo_url: The repository URL.
+        paths: Sparse checkout style patterns of the paths to extract.
+        target_dir: Directory to extract into.
+        branch: Optional branch to download. Defaults to the default branch.
+        token: Optional GitHub token for authentication.
+
+    Returns:
+        True if the tarball was extracted, False if the repository is not
+        on GitHub.
+
+    Raises:
+        urllib.error.URLError: If the download fails.
+        tarfile.TarError: If the archive is invalid or has unsafe members.
+    """
+    repo_path = _github_repo_path(repo_url)
+    if repo_path is None:
+        return False
+    url = f"{GITHUB_API_URL}/repos/{repo_path}/tarball"
+    if branch:
+        url += f"/{quote(branch, safe='')}"
+
+    symlinks = []
+    request = _github_api_request(url, token)
+    with urllib.request.urlopen(request, timeout=GITHUB_DOWNLOAD_TIMEOUT) as response:
+        with tarfile.open(fileobj=response, mode="r|gz") as tar:
+            for member in tar:
+                # Members are nested in an <owner>-<repo>-<sha>/ directory
+                _, _, name = member.name.partition("/")
+                if not name or ".." in name.split("/"):
+                    continue
+                if not _matches_sparse_path(name.rstrip("/"), paths):
+                    continue
+                member.name = name
+                tar.extract(member, target_dir, **_TAR_EXTRACT_KWARGS)
+                if member.issym():
+                    symlinks.append(target_dir / name)
+
+    for link in symlinks:
+        if not link.exists():
+            link.unlink()
+    return True
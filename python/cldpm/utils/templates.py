@@ -0,0 +1,55 @@
+"""Jinja2 template loading shared by the commands."""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from jinja2 import BytecodeCache, Environment, Template
+
+
+def _bytecode_cache() -> "Optional[BytecodeCache]":
+    """Get an on-disk cache for compiled templates, if one can be created.
+
+    Entries are keyed by template source checksum, so a package upgrade
+    never picks up stale bytecode.
+    """
+    from jinja2 import FileSystemBytecodeCache
+
+    try:
+        # Defaults to a private per-user directory under the system temp dir
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_template_env() -> "Environment":
+    """Get the template environment, importing Jinja on first use.
+
+    Packaged templates never change at runtime, so the up-to-date checks
+    are skipped. Compiled templates are shared across invocations via the
+    bytecode cache.
+
+    Returns:
+        The shared Environment for the packaged templates.
+    """
+    from jinja2 import Environment, PackageLoader
+
+    return Environment(
+        loader=PackageLoader("cldpm", "templates"),
+        auto_reload=False,
+        bytecode_cache=_bytecode_cache(),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_template(name: str) -> "Template":
+    """Get a compiled packaged template, loading it at most once per process.
+
+    Args:
+        name: Template file name, e.g. ``CLAUDE.md.j2``.
+
+    Returns:
+        The compiled Template.
+    """
+    return get_template_env().get_template(name)
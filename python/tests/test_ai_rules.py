@@ -0,0 +1,141 @@
+"""Tests for AI rules file generation."""
+
+import builtins
+import io
+import os
+from pathlib import Path
+
+from cldpm.ai_rules import (
+    CLDPM_SECTION_END,
+    CLDPM_SECTION_MARKER,
+    CLDPM_SECTION_START,
+    append_to_claude_md,
+    create_ai_rules,
+    get_claude_md_section,
+    get_clinerules_content,
+)
+
+
+def test_create_ai_rules_new_repo(tmp_path):
+    """Test that all AI rules files are created."""
+    create_ai_rules(tmp_path, "repo", "projects", "shared")
+
+    assert (tmp_path / ".cursor" / "rules" / "cldpm.mdc").exists()
+    assert (tmp_path / ".clinerules").read_text() == get_clinerules_content(
+        "repo", "projects", "shared"
+    )
+    assert (tmp_path / ".windsurfrules").exists()
+    assert (tmp_path / ".github" / "copilot-instructions.md").exists()
+
+
+def test_create_ai_rules_appends_to_existing_file(tmp_path):
+    """Test that the CLDPM section is appended to user content."""
+    clinerules = tmp_path / ".clinerules"
+    clinerules.write_text("# My rules\n")
+
+    create_ai_rules(tmp_path, "repo", "projects", "shared", existing=True)
+
+    content = clinerules.read_text()
+    assert content.startswith("# My rules\n")
+    assert content.count(CLDPM_SECTION_START) == 1
+
+
+def test_create_ai_rules_updates_existing_section(tmp_path):
+    """Test that an outdated CLDPM section is replaced in place."""
+    clinerules = tmp_path / ".clinerules"
+    clinerules.write_text(
+        f"# Before\n{CLDPM_SECTION_START}\nold\n{CLDPM_SECTION_END}\n# After\n"
+    )
+
+    create_ai_rules(tmp_path, "repo", "projects", "shared", existing=True)
+
+    content = clinerules.read_text()
+    assert content.startswith("# Before\n")
+    assert content.endswith("# After\n")
+    assert "\nold\n" not in content
+    assert "cldpm create project" in content
+
+
+def test_create_ai_rules_skips_unchanged_files(tmp_path):
+    """Test that re-running does not rewrite up-to-date files."""
+    create_ai_rules(tmp_path, "repo", "projects", "shared", existing=True)
+    clinerules = tmp_path / ".clinerules"
+    os.utime(clinerules, ns=(0, 0))
+
+    create_ai_rules(tmp_path, "repo", "projects", "shared", existing=True)
+
+    assert clinerules.stat().st_mtime_ns == 0
+
+
+def test_create_ai_rules_fresh_write_skips_identical_files(tmp_path):
+    """Test that overwrite mode leaves files with identical content untouched."""
+    create_ai_rules(tmp_path, "repo", "projects", "shared")
+    cursor_rules = tmp_path / ".cursor" / "rules" / "cldpm.mdc"
+    os.utime(cursor_rules, ns=(0, 0))
+
+    create_ai_rules(tmp_path, "repo", "projects", "shared")
+    assert cursor_rules.stat().st_mtime_ns == 0
+
+    create_ai_rules(tmp_path, "renamed", "projects", "shared")
+    assert cursor_rules.stat().st_mtime_ns != 0
+    assert "renamed/" in cursor_rules.read_text()
+
+
+def test_create_ai_rules_skips_unmarked_cldpm_content(tmp_path):
+    """Test that old-style CLDPM content without markers is left alone."""
+    clinerules = tmp_path / ".clinerules"
+    clinerules.write_text("# CLDPM rules\n")
+
+    create_ai_rules(tmp_path, "repo", "projects", "shared", existing=True)
+
+    assert clinerules.read_text() == "# CLDPM rules\n"
+
+
+def test_create_ai_rules_never_opens_unchanged_files_for_writing(tmp_path, monkeypatch):
+    """Test that files left alone are only read, so read-only files still work."""
+    create_ai_rules(tmp_path, "repo", "projects", "shared", existing=True)
+    (tmp_path / ".windsurfrules").write_text("# CLDPM rules\n")
+    unchanged = {tmp_path / ".clinerules", tmp_path / ".windsurfrules"}
+
+    real_open = io.open
+
+    def read_only_open(file, mode="r", *args, **kwargs):
+        if Path(file) in unchanged and mode != "rb":
+            raise PermissionError(f"read-only: {file}")
+        return real_open(file, mode, *args, **kwargs)
+
+    monkeypatch.setattr(io, "open", read_only_open)
+    monkeypatch.setattr(builtins, "open", read_only_open)
+
+    create_ai_rules(tmp_path, "repo", "projects", "shared", existing=True)
+
+
+def test_append_to_claude_md_appends_section(tmp_path):
+    """Test appending the CLDPM section to a CLAUDE.md without one."""
+    claude_md = tmp_path / "CLAUDE.md"
+    claude_md.write_text("# Project\n")
+
+    append_to_claude_md(claude_md)
+
+    assert claude_md.read_text() == "# Project\n" + get_claude_md_section()
+
+
+def test_append_to_claude_md_replaces_legacy_section(tmp_path):
+    """Test that legacy marker sections are upgraded."""
+    claude_md = tmp_path / "CLAUDE.md"
+    claude_md.write_text(
+        f"# Project\n{CLDPM_SECTION_MARKER}\nold\n{CLDPM_SECTION_MARKER}\n"
+    )
+
+    append_to_claude_md(claude_md)
+
+    content = claude_md.read_text()
+    assert CLDPM_SECTION_MARKER not in content
+    assert content == "# Project\n" + get_claude_md_section().strip() + "\n"
+
+
+def test_append_to_claude_md_missing_file(tmp_path):
+    """Test that a missing CLAUDE.md is not created."""
+    append_to_claude_md(tmp_path / "CLAUDE.md")
+
+    assert not (tmp_path / "CLAUDE.md").exists()
@@ -0,0 +1,53 @@
+"""Tests for the cldpm command group."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter, so no command is imported yet."""
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+
+
+@pytest.mark.parametrize("module", ["get", "link", "sync"])
+def test_dispatch_after_submodule_import(module):
+    """Test that importing a command submodule does not shadow the command."""
+    result = run_python(
+        f"import cldpm.commands.{module}\n"
+        "from cldpm.cli import cli\n"
+        f"cli(['{module}', '--help'])\n"
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "Usage:" in result.stdout
+
+
+def test_package_attribute_after_submodule_import():
+    """Test that package attributes stay commands after loading their submodule."""
+    result = run_python(
+        "import click\n"
+        "from cldpm import commands\n"
+        "commands.unlink\n"
+        "import cldpm.commands.get\n"
+        "assert isinstance(commands.link, click.Command)\n"
+        "assert isinstance(commands.get, click.Command)\n"
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_help_lists_commands():
+    """Test that the top-level help lists every command."""
+    result = run_python(
+        "import cldpm.commands.get\n"
+        "from cldpm.cli import cli\n"
+        "cli(['--help'])\n"
+    )
+
+    assert result.returncode == 0, result.stderr
+    for name in ["init", "create", "add", "remove", "link", "unlink", "get", "sync"]:
+        assert name in result.stdout
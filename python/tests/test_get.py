@@ -1,8 +1,16 @@
 """Tests for cldpm get command."""
 
+import base64
+import http.client
 import json
+import os
+import shutil
+import urllib.error
 from pathlib import Path
+from unittest import mock
+from urllib.parse import unquote
 
+import click
 import pytest
 from click.testing import CliRunner
 
@@ -200,6 +208,24 @@ def test_get_download_with_shared_components(runner, tmp_path):
         assert (skill_path / "skill.json").exists()
 
 
+def test_get_download_with_multiple_shared_components(runner, tmp_path):
+    """Test that every shared component is copied when there are several."""
+    with runner.isolated_filesystem(temp_dir=tmp_path):
+        runner.invoke(cli, ["init"])
+        runner.invoke(cli, ["create", "project", "my-project"])
+        for name in ("skill-a", "skill-b", "skill-c"):
+            create_shared_skill(name)
+            runner.invoke(cli, ["add", f"skill:{name}", "--to", "my-project"])
+
+        result = runner.invoke(cli, ["get", "my-project", "--download"])
+
+        assert result.exit_code == 0
+        skills_dir = Path("my-project/.claude/skills")
+        for name in ("skill-a", "skill-b", "skill-c"):
+            assert not (skills_dir / name).is_symlink()
+            assert (skills_dir / name / "SKILL.md").exists()
+
+
 def test_get_download_with_local_components(runner, tmp_path):
     """Test that local components are preserved in download."""
     with runner.isolated_filesystem(temp_dir=tmp_path):
@@ -218,6 +244,44 @@ def test_get_download_with_local_components(runner, tmp_path):
         assert (skill_path / "SKILL.md").exists()
 
 
+def test_get_download_preserves_executable_hooks(runner, tmp_path):
+    """Test that downloaded hook scripts keep their executable bit."""
+    with runner.isolated_filesystem(temp_dir=tmp_path):
+        runner.invoke(cli, ["init"])
+        runner.invoke(cli, ["create", "project", "my-project"])
+        hook_path = Path("projects/my-project/.claude/hooks/pre-commit.sh")
+        hook_path.parent.mkdir(parents=True, exist_ok=True)
+        hook_path.write_text("#!/bin/sh\n")
+        hook_path.chmod(0o755)
+
+        result = runner.invoke(cli, ["get", "my-project", "--download"])
+
+        assert result.exit_code == 0
+        copied = Path("my-project/.claude/hooks/pre-commit.sh")
+        assert copied.read_text() == "#!/bin/sh\n"
+        assert os.access(copied, os.X_OK)
+
+
+def test_get_download_hardlink(runner, tmp_path):
+    """Test that --hardlink links downloaded files to the repo copies."""
+    with runner.isolated_filesystem(temp_dir=tmp_path):
+        runner.invoke(cli, ["init"])
+        runner.invoke(cli, ["create", "project", "my-project"])
+        create_shared_skill("test-skill")
+        runner.invoke(cli, ["add", "skill:test-skill", "--to", "my-project"])
+
+        result = runner.invoke(cli, ["get", "my-project", "-d", "--hardlink"])
+
+        assert result.exit_code == 0
+        source = Path("shared/skills/test-skill/SKILL.md")
+        linked = Path("my-project/.claude/skills/test-skill/SKILL.md")
+        assert not linked.is_symlink()
+        assert os.path.samefile(source, linked)
+        assert os.path.samefile(
+            "projects/my-project/project.json", "my-project/project.json"
+        )
+
+
 def test_get_download_with_both_shared_and_local(runner, tmp_path):
     """Test downloading project with both shared and local components."""
     with runner.isolated_filesystem(temp_dir=tmp_path):
@@ -507,6 +571,64 @@ class TestBuildSparseResult:
         assert len(local_skills) == 1
         assert local_skills[0]["name"] == "my-skill"
 
+    def test_build_tree_result_matches_sparse_result(self, tmp_path):
+        """Test that the GitHub tree result matches the sparse clone result."""
+        from cldpm.commands.get import _build_sparse_result, _build_tree_result
+
+        project_path = "projects/test-project"
+        project_dir = tmp_path / project_path
+        (project_dir / ".claude" / "skills" / "local-skill").mkdir(parents=True)
+        (project_dir / ".claude" / "skills" / "local-skill" / "SKILL.md").write_text("")
+        (project_dir / ".claude" / "skills" / ".gitignore").write_text("*")
+        (project_dir / ".claude" / "rules").mkdir()
+        (project_dir / ".claude" / "rules" / "style.md").write_text("")
+        (tmp_path / "shared" / "skills" / "my-skill").mkdir(parents=True)
+        (tmp_path / "shared" / "skills" / "my-skill" / "SKILL.md").write_text("")
+        (tmp_path / "shared" / "agents").mkdir()
+        (tmp_path / "shared" / "agents" / "reviewer.md").write_text("")
+        (tmp_path / "shared" / "agents" / "x.md").write_text("")
+        (tmp_path / "shared" / "agents" / "x.md.bak").write_text("")
+
+        index = {}
+        for path in tmp_path.rglob("*"):
+            parent = path.parent.relative_to(tmp_path).as_posix()
+            index.setdefault("" if parent == "." else parent, {})[path.name] = (
+                "dir" if path.is_dir() else "file"
+            )
+        index[f"{project_path}/.claude/skills"]["linked"] = "symlink"
+
+        project_config = {"name": "test-project"}
+        dependencies = {"skills": ["my-skill"], "agents": ["reviewer", "x.md", "missing"]}
+        args = (
+            "test-project", project_path, "shared", project_config, dependencies,
+            "owner/repo", "https://github.com/owner/repo.git", "main",
+        )
+
+        expected = _build_sparse_result(tmp_path, *args)
+        result = _build_tree_result(index, *args)
+
+        # The clone reports its checkout, the API view the repository path
+        assert expected.pop("path") == str(tmp_path / project_path)
+        assert result.pop("path") == project_path
+        assert [a["name"] for a in expected["shared"]["agents"]] == ["reviewer", "x.md"]
+        assert result == expected
+
+    def test_build_tree_result_rejects_shared_symlinks(self):
+        """Test that symlinked shared components defer to a checkout."""
+        from cldpm.commands.get import _build_tree_result
+
+        index = {
+            "projects/test-project": {"project.json": "file"},
+            "shared/skills": {"my-skill": "symlink"},
+        }
+
+        with pytest.raises(ValueError):
+            _build_tree_result(
+                index, "test-project", "projects/test-project", "shared",
+                {"name": "test-project"}, {"skills": ["my-skill"]},
+                "owner/repo", "https://github.com/owner/repo.git", None,
+            )
+
 
 def test_get_download_default_uses_project_id(runner, tmp_path):
     """Test default download directory uses project id, not display name."""
@@ -519,3 +641,234 @@ def test_get_download_default_uses_project_id(runner, tmp_path):
         assert result.exit_code == 0
         assert Path("my-project").exists()
         assert not Path("My Project").exists()
+
+
+class TestRemoteGetApi:
+    """Tests for the clone-free GitHub API view."""
+
+    TREE = [
+        {"path": "cldpm.json", "mode": "100644", "type": "blob"},
+        {"path": "projects", "mode": "040000", "type": "tree"},
+        {"path": "projects/app", "mode": "040000", "type": "tree"},
+        {"path": "projects/app/project.json", "mode": "100644", "type": "blob"},
+        {"path": "shared", "mode": "040000", "type": "tree"},
+        {"path": "shared/skills", "mode": "040000", "type": "tree"},
+        {"path": "shared/skills/my-skill", "mode": "040000", "type": "tree"},
+        {"path": "shared/skills/my-skill/SKILL.md", "mode": "100644", "type": "blob"},
+    ]
+    FILES = {
+        "cldpm.json": b'{"name": "repo"}',
+        "projects/app/project.json": b'{"name": "app", "dependencies": {"skills": ["my-skill"]}}',
+    }
+
+    def invoke(self, runner, tree=None, files=None, error=None):
+        """Run a remote get against a fake GitHub API, recording any clone."""
+        tree = {"tree": self.TREE} if tree is None else tree
+        files = self.FILES if files is None else files
+
+        def api_get(url, token):
+            if error is not None:
+                raise error
+            if "/git/trees/" in url:
+                return tree
+            path = unquote(url.split("/contents/", 1)[1].split("?", 1)[0])
+            if path not in files:
+                raise urllib.error.HTTPError(url, 404, "Not Found", {}, None)
+            return {"encoding": "base64", "content": base64.b64encode(files[path]).decode()}
+
+        with mock.patch("cldpm.utils.git._github_api_get", side_effect=api_get), mock.patch(
+            "cldpm.utils.git.has_sparse_clone_support", return_value=True
+        ), mock.patch(
+            "cldpm.commands.get._handle_remote_get_sparse",
+            side_effect=lambda *args: click.echo("cloned"),
+        ) as mock_sparse:
+            result = runner.invoke(
+                cli,
+                ["get", "app", "-r", "https://github.com/owner/repo", "-f", "json"],
+                env={"GITHUB_TOKEN": "token"},
+            )
+
+        assert result.exit_code == 0, result.output
+        return result, mock_sparse
+
+    def test_api_view_skips_clone(self, runner):
+        """Test that a GitHub project is viewed without cloning."""
+        result, mock_sparse = self.invoke(runner)
+
+        mock_sparse.assert_not_called()
+        output = json.loads(result.output)
+        assert output["path"] == "projects/app"
+        assert output["shared"]["skills"][0]["files"] == ["SKILL.md"]
+
+    def test_rate_limit_falls_back(self, runner):
+        """Test that an API error such as a rate limit falls back to cloning."""
+        error = urllib.error.HTTPError(
+            "https://api.github.com", 403, "rate limit exceeded", {}, None
+        )
+        result, mock_sparse = self.invoke(runner, error=error)
+
+        mock_sparse.assert_called_once()
+        assert result.output == "cloned\n"
+
+    def test_truncated_tree_falls_back(self, runner):
+        """Test that a truncated tree listing falls back to cloning."""
+        result, mock_sparse = self.invoke(runner, tree={"tree": self.TREE, "truncated": True})
+
+        mock_sparse.assert_called_once()
+        assert result.output == "cloned\n"
+
+    def test_missing_project_json_falls_back(self, runner):
+        """Test that a project not found by path falls back to cloning."""
+        result, mock_sparse = self.invoke(runner, files={"cldpm.json": b"{}"})
+
+        mock_sparse.assert_called_once()
+        assert result.output == "cloned\n"
+
+    def test_malformed_cldpm_json_falls_back(self, runner):
+        """Test that an unparsable cldpm.json falls back to cloning."""
+        files = {**self.FILES, "cldpm.json": b"{not json"}
+        result, mock_sparse = self.invoke(runner, files=files)
+
+        mock_sparse.assert_called_once()
+        assert result.output == "cloned\n"
+
+    def test_symlinked_shared_component_falls_back(self, runner):
+        """Test that a symlinked shared component falls back to cloning."""
+        tree = [entry for entry in self.TREE if not entry["path"].startswith("shared/skills/")]
+        tree.append({"path": "shared/skills/my-skill", "mode": "120000", "type": "blob"})
+        result, mock_sparse = self.invoke(runner, tree={"tree": tree})
+
+        mock_sparse.assert_called_once()
+        assert result.output == "cloned\n"
+
+
+class TestRemoteGetTarball:
+    """Tests for the GitHub tarball download path."""
+
+    def test_sparse_clone_is_preferred(self):
+        """Test that the tarball is only used when sparse checkout is unavailable."""
+        from cldpm.commands.get import _handle_remote_get
+
+        with mock.patch(
+            "cldpm.utils.git.has_sparse_clone_support", return_value=True
+        ), mock.patch(
+            "cldpm.commands.get._handle_remote_get_sparse"
+        ) as mock_sparse, mock.patch(
+            "cldpm.commands.get._handle_remote_get_tarball"
+        ) as mock_tarball:
+            _handle_remote_get("app", "tree", "owner/repo", True, None)
+
+        mock_sparse.assert_called_once()
+        mock_tarball.assert_not_called()
+
+    def test_dropped_stream_falls_back_silently(self, capsys):
+        """Test that a truncated download falls back without printing."""
+        from cldpm.commands.get import _handle_remote_get_tarball
+
+        configs = {"cldpm.json": b"{}", "projects/app/project.json": b"{}"}
+        with mock.patch(
+            "cldpm.utils.git.fetch_github_file",
+            side_effect=lambda repo_url, path, *args: configs.get(path),
+        ), mock.patch(
+            "cldpm.utils.git.download_github_tarball",
+            side_effect=http.client.IncompleteRead(b""),
+        ):
+            assert not _handle_remote_get_tarball(
+                "app", "tree", "owner/repo", None,
+                "https://github.com/owner/repo.git", None, None,
+            )
+
+        assert capsys.readouterr().out == ""
+
+
+class TestCopyHelpers:
+    """Tests for the download copy helpers."""
+
+    def test_copy_project_files_counts_local_components(self, tmp_path):
+        """Test that copying reports local components, skipping symlinks."""
+        from cldpm.commands.get import _copy_project_files
+
+        source = tmp_path / "project"
+        skills = source / ".claude" / "skills"
+        (skills / "local-skill").mkdir(parents=True)
+        (skills / "local-skill" / "SKILL.md").write_text("# Local")
+        (skills / ".gitignore").write_text("*")
+        os.symlink(skills / "local-skill", skills / "linked-skill")
+        (source / ".claude" / "rules").mkdir()
+        (source / ".claude" / "rules" / "style.md").write_text("# Style")
+        target = tmp_path / "out"
+        target.mkdir()
+
+        counts = _copy_project_files(source, target)
+
+        assert counts == {"skills": 1, "agents": 0, "hooks": 0, "rules": 1}
+        assert (target / ".claude" / "skills" / "local-skill" / "SKILL.md").exists()
+        assert not (target / ".claude" / "skills" / "linked-skill").exists()
+
+    def test_copy_shared_components_file_and_directory(self, tmp_path):
+        """Test copying shared components stored as files and as directories."""
+        from cldpm.commands.get import _copy_shared_components
+
+        shared = tmp_path / "shared"
+        (shared / "skills" / "logging").mkdir(parents=True)
+        (shared / "skills" / "logging" / "SKILL.md").write_text("# Logging")
+        (shared / "rules").mkdir()
+        (shared / "rules" / "style.md").write_text("# Style")
+        target = tmp_path / "out"
+        (target / ".claude" / "skills" / "logging").mkdir(parents=True)
+        (target / ".claude" / "skills" / "logging" / "SKILL.md").write_text("# Local")
+
+        _copy_shared_components(
+            shared, target, {"skills": ["logging"], "rules": ["style", "missing"]}
+        )
+
+        assert (target / ".claude" / "rules" / "style.md").read_text() == "# Style"
+        # Existing components in the target are not overwritten
+        assert (target / ".claude" / "skills" / "logging" / "SKILL.md").read_text() == "# Local"
+
+    @pytest.mark.parametrize("copy_file_range_fails", [False, True])
+    def test_fast_copy_copies_content_and_mode(
+        self, tmp_path, monkeypatch, copy_file_range_fails
+    ):
+        """Test that _fast_copy matches shutil.copy, with or without copy_file_range."""
+        from cldpm.commands.get import _fast_copy
+
+        if copy_file_range_fails:
+            def refuse(*args):
+                raise OSError(18, "Invalid cross-device link")
+
+            monkeypatch.setattr(os, "copy_file_range", refuse, raising=False)
+
+        source = tmp_path / "hook.sh"
+        source.write_bytes(b"#!/bin/sh\n" * 10000)
+        source.chmod(0o755)
+        dest = tmp_path / "copy.sh"
+
+        _fast_copy(source, dest)
+
+        assert dest.read_bytes() == source.read_bytes()
+        assert os.access(dest, os.X_OK)
+
+    def test_fast_copy_falls_back_when_nothing_is_copied(self, tmp_path, monkeypatch):
+        """Test that a copy_file_range reporting 0 for a non-empty file falls back."""
+        from cldpm.commands.get import _fast_copy
+
+        monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+        source = tmp_path / "rule.md"
+        source.write_text("# Rule")
+        dest = tmp_path / "copy.md"
+
+        _fast_copy(source, dest)
+
+        assert dest.read_text() == "# Rule"
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires FIFOs")
+    def test_fast_copy_rejects_fifo_without_opening_it(self, tmp_path):
+        """Test that a FIFO is handed to shutil.copy instead of blocking on open."""
+        from cldpm.commands.get import _fast_copy
+
+        source = tmp_path / "pipe"
+        os.mkfifo(source)
+
+        with pytest.raises(shutil.SpecialFileError):
+            _fast_copy(source, tmp_path / "copy")
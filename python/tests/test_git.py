@@ -1,6 +1,10 @@
 """Tests for git utility functions."""
 
+import base64
+import io
+import json
 import os
+import tarfile
 import tempfile
 from pathlib import Path
 from unittest import mock
@@ -8,9 +12,14 @@ from unittest import mock
 import pytest
 
 from cldpm.utils.git import (
+    download_github_tarball,
+    export_checkout,
+    fetch_github_file,
+    fetch_github_tree,
     get_github_token,
     has_sparse_clone_support,
     parse_repo_url,
+    sparse_checkout_set,
     sparse_clone_paths,
     sparse_clone_to_temp,
 )
@@ -266,3 +275,142 @@ class TestSparseCloneToTemp:
             assert call_args[0][1] == ["path1", "path2"]
             assert call_args[0][3] == "main"  # branch
             assert call_args[0][4] == "test-token"  # token
+
+
+class TestSparseCheckoutSet:
+    """Tests for sparse_checkout_set function."""
+
+    def test_sets_paths_in_existing_clone(self):
+        """Test that the checkout is changed in place without cloning."""
+        with mock.patch("subprocess.run") as mock_run:
+            clone_dir = Path("/tmp/clone")
+            sparse_checkout_set(clone_dir, ["projects/app", "shared/skills/a"])
+
+            mock_run.assert_called_once()
+            cmd = mock_run.call_args[0][0]
+            assert cmd == [
+                "git", "sparse-checkout", "set", "--no-cone",
+                "projects/app", "shared/skills/a",
+            ]
+            assert "clone" not in cmd
+            assert mock_run.call_args[1]["cwd"] == clone_dir
+
+
+class TestExportCheckout:
+    """Tests for export_checkout function."""
+
+    def test_skips_git_dir_and_broken_symlinks(self, tmp_path):
+        """Test that .git and broken symlinks are not exported."""
+        clone_dir = tmp_path / "clone"
+        (clone_dir / ".git").mkdir(parents=True)
+        (clone_dir / "cldpm.json").write_text("{}")
+        (clone_dir / "broken").symlink_to(clone_dir / "missing")
+
+        target = tmp_path / "out"
+        export_checkout(clone_dir, target)
+
+        assert (target / "cldpm.json").read_text() == "{}"
+        assert not (target / ".git").exists()
+        assert not (target / "broken").is_symlink()
+
+
+class TestFetchGithub:
+    """Tests for fetch_github_tree and fetch_github_file functions."""
+
+    def test_non_github_url_returns_none(self):
+        """Test that non-GitHub repositories are not queried."""
+        with mock.patch("urllib.request.urlopen") as mock_urlopen:
+            assert fetch_github_tree("https://gitlab.com/owner/repo.git") is None
+            assert fetch_github_file("https://gitlab.com/owner/repo.git", "a") is None
+            mock_urlopen.assert_not_called()
+
+    def test_fetch_file_decodes_content(self):
+        """Test that file contents are decoded and the branch is passed."""
+        body = json.dumps({
+            "encoding": "base64",
+            "content": base64.b64encode(b'{"name": "repo"}').decode(),
+        }).encode()
+        with mock.patch(
+            "urllib.request.urlopen", return_value=io.BytesIO(body)
+        ) as mock_urlopen:
+            content = fetch_github_file(
+                "https://github.com/owner/repo.git", "cldpm.json", "main", "token"
+            )
+
+        assert content == b'{"name": "repo"}'
+        request = mock_urlopen.call_args[0][0]
+        assert request.full_url == (
+            "https://api.github.com/repos/owner/repo/contents/cldpm.json?ref=main"
+        )
+        assert request.get_header("Authorization") == "Bearer token"
+
+    def test_truncated_tree_returns_none(self):
+        """Test that a truncated tree listing is rejected."""
+        body = json.dumps({"tree": [], "truncated": True}).encode()
+        with mock.patch("urllib.request.urlopen", return_value=io.BytesIO(body)):
+            assert fetch_github_tree("https://github.com/owner/repo.git") is None
+
+
+class TestDownloadGithubTarball:
+    """Tests for download_github_tarball function."""
+
+    @staticmethod
+    def _tarball(files, symlinks=()):
+        """Build a gzipped tarball shaped like GitHub's, with a prefix dir."""
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+            for name, data in files.items():
+                info = tarfile.TarInfo(f"owner-repo-abc123/{name}")
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+            for name, target in symlinks:
+                info = tarfile.TarInfo(f"owner-repo-abc123/{name}")
+                info.type = tarfile.SYMTYPE
+                info.linkname = target
+                tar.addfile(info)
+        buffer.seek(0)
+        return buffer
+
+    def test_extracts_only_selected_paths(self, tmp_path):
+        """Test that only matching members are extracted, without the prefix."""
+        tarball = self._tarball(
+            {
+                "cldpm.json": b"{}",
+                "projects/app/project.json": b"{}",
+                "projects/other/project.json": b"{}",
+                "shared/skills/logging/SKILL.md": b"# Logging",
+                "shared/skills/review.md": b"# Review",
+                "shared/skills/unused/SKILL.md": b"# Unused",
+            },
+            symlinks=[("projects/app/.claude/skills/unused", "../../../../shared/skills/unused")],
+        )
+        with mock.patch("urllib.request.urlopen", return_value=tarball) as mock_urlopen:
+            assert download_github_tarball(
+                "https://github.com/owner/repo.git",
+                ["projects/app", "shared/skills/logging", "shared/skills/logging.*",
+                 "shared/skills/review", "shared/skills/review.*"],
+                tmp_path,
+                "main",
+            )
+
+        assert mock_urlopen.call_args[0][0].full_url == (
+            "https://api.github.com/repos/owner/repo/tarball/main"
+        )
+        extracted = sorted(
+            p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*") if p.is_file()
+        )
+        assert extracted == [
+            "projects/app/project.json",
+            "shared/skills/logging/SKILL.md",
+            "shared/skills/review.md",
+        ]
+        # Symlinks to shared components that were not extracted are dropped
+        assert not (tmp_path / "projects/app/.claude/skills/unused").is_symlink()
+
+    def test_non_github_url_returns_false(self, tmp_path):
+        """Test that non-GitHub repositories are not downloaded."""
+        with mock.patch("urllib.request.urlopen") as mock_urlopen:
+            assert not download_github_tarball(
+                "https://gitlab.com/owner/repo.git", ["projects/app"], tmp_path
+            )
+            mock_urlopen.assert_not_called()
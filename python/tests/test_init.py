@@ -140,6 +140,24 @@ def test_init_existing_with_adopt_auto(runner, temp_dir):
         assert Path("projects/app2/project.json").exists()
 
 
+def test_init_existing_with_adopt_auto_from_repo_root(runner, temp_dir):
+    """Test auto adoption of repo root directories that look like projects."""
+    with runner.isolated_filesystem(temp_dir=temp_dir):
+        Path("web").mkdir()
+        Path("web/package.json").write_text("{}")
+        Path("docs").mkdir()
+        Path("docs/notes.txt").write_text("notes")
+        Path("node_modules/pkg").mkdir(parents=True)
+        Path("node_modules/pkg/package.json").write_text("{}")
+
+        result = runner.invoke(cli, ["init", "--existing", "--adopt-projects", "auto"])
+
+        assert result.exit_code == 0
+        assert Path("projects/web/project.json").exists()
+        assert not Path("projects/docs").exists()
+        assert not Path("projects/node_modules").exists()
+
+
 def test_init_existing_with_adopt_specific(runner, temp_dir):
     """Test --existing with specific project paths."""
     with runner.isolated_filesystem(temp_dir=temp_dir):
@@ -235,6 +235,22 @@ class TestSyncProjectLinks:
 
         assert "skills/nonexistent" in result["missing"]
 
+    def test_sync_reports_dangling_shared_symlink_missing(self, setup_repo):
+        """Test that a shared component symlink with no target counts as missing."""
+        skills_dir = setup_repo / "shared" / "skills"
+        skills_dir.mkdir(parents=True, exist_ok=True)
+        (skills_dir / "broken").symlink_to(setup_repo / "does-not-exist")
+        project_path = create_project(setup_repo, "my-project", {
+            "skills": ["broken"],
+            "agents": [],
+            "hooks": [],
+            "rules": [],
+        })
+
+        result = sync_project_links(project_path, setup_repo)
+
+        assert "skills/broken" in result["missing"]
+
     def test_sync_updates_gitignore(self, setup_repo):
         """Test that sync updates .gitignore."""
         create_shared_component(setup_repo, "skills", "skill-a")